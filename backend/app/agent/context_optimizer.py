@@ -9,6 +9,18 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# compress_logs patterns, compiled once
+_TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+')
+_MULTISPACE_RE = re.compile(r' +')
+# "stack +trace" so lines can be classified before spaces are collapsed
+_ERR_RE = re.compile(r'error|fatal|exception|stack +trace|failed', re.IGNORECASE)
+_FILEPATH_LINE_RE = re.compile(r'[a-zA-Z0-9_/.-]+\.[a-z]{2,5}:\d+')
+# Error keyword or file:line reference, found in a single scan of the line
+_LINE_CLASS_RE = re.compile(
+    r'(?P<err>(?i:error|fatal|exception|stack +trace|failed))'
+    r'|(?P<file>[a-zA-Z0-9_/.-]+\.[a-z]{2,5}:\d+)'
+)
+
 
 class ContextOptimizer:
     """
@@ -75,32 +87,51 @@ class ContextOptimizer:
         if not raw_logs:
             return ""
         
-        # Remove repeated whitespace and noisy timestamps
-        processed = re.sub(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+', '[TS]', raw_logs)
-        processed = re.sub(r' +', ' ', processed)
-        
         if not preserve_errors:
-            # Simple truncation for non-critical logs
+            # Remove repeated whitespace and noisy timestamps, then simply
+            # truncate non-critical logs
+            processed = _MULTISPACE_RE.sub(' ', _TIMESTAMP_RE.sub('[TS]', raw_logs))
             return processed[:2000] if len(processed) > 2000 else processed
         
-        # Identify common compiler error patterns
-        lines = processed.split('\n')
+        # Identify common compiler error patterns. Lines are classified as-is
+        # (the timestamp/space normalization cannot change their class) and
+        # only normalized when kept, so once the context quota is full the
+        # bulk of an uneventful log is scanned once and never copied.
         filtered_lines: List[str] = []
+        keep_context = True  # Keep some context if log is small
         
-        for line in lines:
-            line = line.strip()
+        for raw_line in raw_logs.splitlines():
+            line = raw_line.strip()
             if not line:
                 continue
             
-            # Keep error/fatal lines and lines with file paths
-            if any(key in line.lower() for key in ['error', 'fatal', 'exception', 'stack trace', 'failed']):
-                filtered_lines.append(f"! {line}")
-            elif re.search(r'[a-zA-Z0-9_/.-]+\.[a-z]{2,5}:\d+', line):
-                filtered_lines.append(f"@ {line}")
+            # Keep error/fatal lines and lines with file paths. Errors win over
+            # file references, so a file match is re-checked for a later error
+            # keyword (possibly inside the path, e.g. "failed.ts:3")
+            normalized = None
+            match = _LINE_CLASS_RE.search(line)
+            if match is not None and (
+                match.lastgroup == 'err' or _ERR_RE.search(line, match.start() + 1)
+            ):
+                prefix = "!"
+            elif match is not None and _FILEPATH_LINE_RE.search(
+                normalized := _MULTISPACE_RE.sub(' ', _TIMESTAMP_RE.sub('[TS]', line))
+            ):
+                # Re-checked after normalization: "foo.py:2024-01-01 ..." loses
+                # its file:line match once the timestamp becomes [TS]
+                prefix = "@"
             elif line.startswith('WARNING'):
-                filtered_lines.append(f"? {line}")
-            elif len(filtered_lines) < 20:  # Keep some context if log is small
-                filtered_lines.append(f". {line}")
+                prefix = "?"
+            elif keep_context:
+                prefix = "."
+            else:
+                continue
+            
+            if normalized is None:
+                normalized = _MULTISPACE_RE.sub(' ', _TIMESTAMP_RE.sub('[TS]', line))
+            filtered_lines.append(f"{prefix} {normalized}")
+            if keep_context and len(filtered_lines) >= 20:
+                keep_context = False
         
         compressed = "\n".join(filtered_lines)
         
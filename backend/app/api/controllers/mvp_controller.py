@@ -102,9 +102,10 @@ async def stream_mvp_events(
                 "type": "connect",
                 "data": {"status": "connected", "mvp_id": mvp_id},
             }
-            yield f"event: connect\ndata: {json.dumps(connect_data)}\n\n"
+            yield f"event: connect\ndata: {json.dumps(connect_data)}\n\n".encode("utf-8")
 
             while True:
+                # Frames are queued already encoded
                 message = await queue.get()
                 yield message
         except asyncio.CancelledError:
@@ -32,6 +32,11 @@ class Config:
 
     EIDO_WEBHOOK_URL = os.getenv("EIDO_WEBHOOK_URL")
     EIDO_API_KEY = os.getenv("EIDO_API_KEY")
+    # Queue notify/post webhooks and send them to Eido's /batch endpoint, which
+    # must implement the contract in EidoWebhookClient.post_batch
+    EIDO_WEBHOOK_BATCHING = os.getenv("EIDO_WEBHOOK_BATCHING", "false").lower() == "true"
+    EIDO_WEBHOOK_BATCH_MAX_SIZE = int(os.getenv("EIDO_WEBHOOK_BATCH_MAX_SIZE", "16"))
+    EIDO_WEBHOOK_BATCH_MAX_WAIT_MS = int(os.getenv("EIDO_WEBHOOK_BATCH_MAX_WAIT_MS", "50"))
 
     E2B_API_KEY = os.getenv("E2B_API_KEY")
 
@@ -40,6 +45,8 @@ class Config:
 
     MAX_STAGE_RETRIES = int(os.getenv("MAX_STAGE_RETRIES", "2"))
     MAX_LLM_RETRIES = int(os.getenv("MAX_LLM_RETRIES", "3"))
+    MAX_CONCURRENT_LLM_CALLS = int(os.getenv("MAX_CONCURRENT_LLM_CALLS", "8"))
+    LLM_TOTAL_TIMEOUT_SECONDS = float(os.getenv("LLM_TOTAL_TIMEOUT_SECONDS", "180"))
     MAX_TOOL_INVOCATIONS = int(os.getenv("MAX_TOOL_INVOCATIONS", "50"))
     MAX_TOTAL_RUNTIME = int(os.getenv("MAX_TOTAL_RUNTIME", "3600"))
     MAX_TOTAL_COST = float(os.getenv("MAX_TOTAL_COST", "10.0"))
@@ -51,6 +58,8 @@ class Config:
     DEPLOYMENT_LLM_MODEL = os.getenv("DEPLOYMENT_LLM_MODEL", "gemma2-9b-it")
     TOKENIZATION_LLM_MODEL = os.getenv("TOKENIZATION_LLM_MODEL", "mixtral-8x7b-32768")
     SUMMARY_LLM_MODEL = os.getenv("SUMMARY_LLM_MODEL", "llama-3.1-8b-instant")
+    # Model for JSON repair retries after a validation failure (empty = same model as the task)
+    REPAIR_LLM_MODEL = os.getenv("REPAIR_LLM_MODEL", "")
 
     AGENT_MODEL_MAPPING = {
         "analyst": os.getenv("ANALYST_LLM_MODEL", "ollama/glm-5:cloud"),
@@ -86,11 +95,20 @@ class Config:
     MAX_CONTEXT_TOKENS = int(os.getenv("MAX_CONTEXT_TOKENS", "8000"))
     MAX_PROMPT_SIZE = int(os.getenv("MAX_PROMPT_SIZE", "16000"))
 
+    # Off by default: cached generations would be replayed for sampled outputs and retries
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+    LLM_CACHE_STORAGE = os.getenv("LLM_CACHE_STORAGE", "memory")
+    LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+
     ALLOWED_TOOL_PATHS = os.getenv("ALLOWED_TOOL_PATHS", "/tmp/eido,./workspace").split(",")
     MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", "10"))
     TOOL_EXECUTION_TIMEOUT = int(os.getenv("TOOL_EXECUTION_TIMEOUT", "30"))
     ALLOWED_COMMANDS = os.getenv("ALLOWED_COMMANDS", "ls,cat,echo,mkdir,touch").split(",")
 
+    SSE_QUEUE_MAX = int(os.getenv("SSE_QUEUE_MAX", "1024"))
+    SSE_COALESCE_MS = int(os.getenv("SSE_COALESCE_MS", "25"))
+
     RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
     RATE_LIMIT_STORAGE = os.getenv("RATE_LIMIT_STORAGE", "memory")
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -23,6 +23,11 @@ def init_db() -> None:
 
     logger.info("Initializing database tables")
     SQLModel.metadata.create_all(engine)
+    # create_all skips tables that already exist, so add indexes introduced
+    # since those tables were created
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     logger.success("Database tables initialized successfully")
 
 
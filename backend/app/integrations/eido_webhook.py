@@ -1,20 +1,37 @@
 import httpx
 import asyncio
-from typing import Dict, Any, Optional
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
 from ..config.settings import config
 from ..logger import get_logger
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 logger = get_logger(__name__)
 
+# Connection pool sizing for the shared client; the keep-alive pool is what
+# lets chained tool calls skip the TCP/TLS handshake
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
 class EidoWebhookClient:
     """Client for communicating with the Dockerized Eido Master Agent."""
 
+    # One pooled HTTP client per event loop, shared by all instances (an
+    # httpx.AsyncClient cannot be used across loops)
+    _http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
     def __init__(self):
         self.webhook_url = config.EIDO_WEBHOOK_URL
         self.api_key = config.EIDO_API_KEY
         self.timeout = 10.0
 
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._http_clients[loop] = httpx.AsyncClient(timeout=self.timeout, limits=_POOL_LIMITS)
+        return client
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -32,37 +49,100 @@ class EidoWebhookClient:
             "Content-Type": "application/json"
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                logger.debug(f"Sending webhook to {url}: {payload.get('type')}")
-                response = await client.post(url, json=payload, headers=headers)
+        client = self._http_client()
+        try:
+            logger.debug(f"Sending webhook to {url}: {payload.get('type')}")
+            response = await client.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Eido Webhook error {e.response.status_code}: {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"Eido Webhook connection failed: {e}")
+            raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True
+    )
+    async def fetch_stream(self, url: str, max_chars: int) -> Dict[str, Any]:
+        """Ask Eido to fetch a page, reading at most max_chars of a plain-text body.
+
+        A JSON reply is parsed as usual (Eido truncates it to max_chars itself);
+        a plain-text reply is streamed and the connection dropped once enough
+        text has arrived.
+        """
+        if not self.webhook_url:
+            logger.warning("EIDO_WEBHOOK_URL not configured. Skipping webhook call.")
+            return {"status": "skipped", "reason": "not_configured"}
+
+        endpoint = f"{self.webhook_url.rstrip('/')}/fetch"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {"type": "fetch", "url": url, "max_chars": max_chars}
+
+        client = self._http_client()
+        try:
+            logger.debug(f"Sending webhook to {endpoint}: fetch")
+            async with client.stream("POST", endpoint, json=payload, headers=headers) as response:
+                if response.is_error:
+                    await response.aread()
                 response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Eido Webhook error {e.response.status_code}: {e.response.text}")
-                raise
-            except Exception as e:
-                logger.error(f"Eido Webhook connection failed: {e}")
-                raise
 
-    async def send_notification(self, message: str, chat_id: Optional[str] = None):
-        """Send a general notification message to Eido (Telegram)."""
+                if "json" in response.headers.get("content-type", ""):
+                    await response.aread()
+                    return response.json()
+
+                chunks = []
+                size = 0
+                truncated = False
+                async for chunk in response.aiter_text():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size > max_chars:
+                        truncated = True
+                        break
+                content = "".join(chunks)[:max_chars]
+                return {"content": content, "truncated": truncated}
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Eido Webhook error {e.response.status_code}: {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"Eido Webhook connection failed: {e}")
+            raise
+
+    @staticmethod
+    def notification_webhook(message: str, chat_id: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """(endpoint, payload) for a notification, for callers that queue it."""
         payload = {
             "type": "notification",
             "message": message,
             "chat_id": chat_id
         }
-        return await self._post("/notify", payload)
+        return "/notify", payload
 
-    async def post_to_moltbook(self, title: str, content: str, submolt: str = "lablab"):
-        """Request Eido to post on Moltbook using his credentials."""
+    @staticmethod
+    def moltbook_post_webhook(title: str, content: str, submolt: str = "lablab") -> Tuple[str, Dict[str, Any]]:
+        """(endpoint, payload) for a Moltbook post, for callers that queue it."""
         payload = {
             "type": "moltbook_post",
             "title": title,
             "content": content,
             "submolt": submolt
         }
-        return await self._post("/moltbook", payload)
+        return "/moltbook", payload
+
+    async def send_notification(self, message: str, chat_id: Optional[str] = None):
+        """Send a general notification message to Eido (Telegram)."""
+        return await self._post(*self.notification_webhook(message, chat_id))
+
+    async def post_to_moltbook(self, title: str, content: str, submolt: str = "lablab"):
+        """Request Eido to post on Moltbook using his credentials."""
+        return await self._post(*self.moltbook_post_webhook(title, content, submolt))
 
     async def report_stage_progress(self, mvp_id: int, stage: str, status: str, details: Optional[str] = None):
         """Report pipeline stage progress to Eido."""
@@ -84,3 +164,30 @@ class EidoWebhookClient:
             "context": context
         }
         return await self._post("/engage", payload)
+
+    async def post_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """Send several (endpoint, payload) webhooks, in one request when there are two or more.
+
+        Contract for Eido's /batch endpoint:
+
+            request:  {"type": "batch", "items": [{"endpoint": "/notify", "payload": {...}}, ...]}
+            response: {"results": [...]}  one reply per item, in request order, each
+                      the reply that item's own endpoint would have returned
+
+        A response without a matching "results" list is used as the reply for
+        every item. A single item is posted to its own endpoint instead.
+        """
+        if len(items) == 1:
+            endpoint, payload = items[0]
+            return [await self._post(endpoint, payload)]
+
+        logger.debug(f"Sending batch of {len(items)} webhooks")
+        response = await self._post("/batch", {
+            "type": "batch",
+            "items": [{"endpoint": endpoint, "payload": payload} for endpoint, payload in items],
+        })
+        results = response.get("results")
+        if not isinstance(results, list) or len(results) != len(items):
+            return [response] * len(items)
+        return results
+
@@ -19,6 +19,7 @@ from .logger import configure_logging, get_logger
 from .middleware.metrics_middleware import metrics_middleware
 from .middleware.rate_limiter import rate_limit_middleware
 from .monitoring import deep_health_check, get_metrics_handler, health_check
+from .services.ai_runtime.llm_router import LLMRouter
 from .services.pipeline import resume_incomplete_pipelines
 
 configure_logging(log_level=config.LOG_LEVEL)
@@ -40,6 +41,8 @@ async def lifespan(app: FastAPI):
     logger.info(f"Metrics: {'enabled' if config.METRICS_ENABLED else 'disabled'}")
 
     init_db()
+    # Load tokenizers off the event loop so the first LLM call doesn't pay for it
+    await asyncio.to_thread(LLMRouter.warmup)
     await resume_incomplete_pipelines()
 
     logger.success("EIDO backend is fully initialized and ready")
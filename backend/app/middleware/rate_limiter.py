@@ -1,8 +1,11 @@
 """Production-grade rate limiting middleware with Redis support."""
 
+import math
+import re
 import time
-from typing import Dict, Optional, Callable
-from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from fastapi import Request, Response, HTTPException
 from fastapi.responses import JSONResponse
@@ -25,12 +28,28 @@ class RateLimitExceeded(HTTPException):
 
 
 class InMemoryRateLimiter:
-    """In-memory rate limiter using sliding window algorithm."""
+    """In-memory rate limiter using the sliding window counter algorithm.
+
+    Each key keeps only the request counts of the current and previous fixed
+    windows; the previous count is weighted by how much of it still overlaps
+    the sliding window. O(1) time and memory per key, whatever the limit.
+    """
     
     def __init__(self):
-        self.requests: Dict[str, list] = defaultdict(list)
+        # key -> (window index, previous window count, current window count)
+        self.windows: Dict[str, Tuple[int, int, int]] = {}
         self.lock = asyncio.Lock()
     
+    def _counts(self, key: str, window: int, now: float) -> Tuple[int, int, int, float]:
+        """Roll key's counters forward to now; returns (index, prev, cur, elapsed)."""
+        index = int(now // window)
+        start, prev, cur = self.windows.get(key, (index, 0, 0))
+        if index == start + 1:
+            prev, cur = cur, 0
+        elif index != start:
+            prev, cur = 0, 0
+        return index, prev, cur, now - index * window
+    
     async def is_allowed(self, key: str, limit: int, window: int) -> tuple[bool, int]:
         """
         Check if request is allowed under rate limit.
@@ -44,36 +63,88 @@ class InMemoryRateLimiter:
             (is_allowed, retry_after_seconds)
         """
         async with self.lock:
-            now = time.time()
-            cutoff = now - window
-            
-            # Remove old requests outside the window
-            self.requests[key] = [req_time for req_time in self.requests[key] if req_time > cutoff]
+            now = time.monotonic()
+            index, prev, cur, elapsed = self._counts(key, window, now)
             
-            # Check if under limit
-            if len(self.requests[key]) < limit:
-                self.requests[key].append(now)
+            # Requests estimated to fall inside the sliding window ending now
+            weight = 1 - elapsed / window
+            if prev * weight + cur < limit:
+                self.windows[key] = (index, prev, cur + 1)
                 return True, 0
             
-            # Calculate retry after
-            oldest_request = min(self.requests[key])
-            retry_after = int(oldest_request + window - now) + 1
+            self.windows[key] = (index, prev, cur)
+            
+            # Calculate retry after: wait for enough of the previous window to
+            # slide out, or for the next window if this one alone is full
+            if cur < limit:
+                wait = window * (1 - (limit - cur) / prev) - elapsed
+            else:
+                wait = (window - elapsed) + window * (1 - limit / cur)
+            retry_after = int(max(wait, 0)) + 1
             
             return False, retry_after
     
     async def get_usage(self, key: str, window: int) -> int:
-        """Get current usage count for a key."""
+        """Get current (estimated) usage count for a key."""
         async with self.lock:
-            now = time.time()
-            cutoff = now - window
-            self.requests[key] = [req_time for req_time in self.requests[key] if req_time > cutoff]
-            return len(self.requests[key])
+            index, prev, cur, elapsed = self._counts(key, window, time.monotonic())
+            return math.ceil(prev * (1 - elapsed / window) + cur)
     
     async def reset(self, key: str) -> None:
         """Reset rate limit for a key."""
         async with self.lock:
-            if key in self.requests:
-                del self.requests[key]
+            self.windows.pop(key, None)
+
+
+class TokenBucketLimiter:
+    """In-memory token bucket rate limiter, selected with a ':bucket' limit suffix.
+
+    Allows bursts of up to `limit` requests, refilled continuously at
+    limit/window tokens per second.
+    """
+    
+    def __init__(self):
+        # key -> [tokens, last refill time, capacity]; a list so it is updated in place
+        self.buckets: Dict[str, list] = {}
+        self.lock = asyncio.Lock()
+    
+    def _refill(self, key: str, limit: int, window: int, now: float) -> list:
+        """Top up key's bucket for the time elapsed since its last refill."""
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = [float(limit), now, limit]
+        else:
+            bucket[0] = min(float(limit), bucket[0] + (now - bucket[1]) * limit / window)
+            bucket[1] = now
+            bucket[2] = limit
+        return bucket
+    
+    async def is_allowed(self, key: str, limit: int, window: int) -> tuple[bool, int]:
+        """Take a token from key's bucket; returns (is_allowed, retry_after_seconds)."""
+        async with self.lock:
+            bucket = self._refill(key, limit, window, time.monotonic())
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return True, 0
+            
+            # Time until one whole token has been refilled
+            retry_after = int((1 - bucket[0]) * window / limit) + 1
+            return False, retry_after
+    
+    async def get_usage(self, key: str, window: int) -> int:
+        """Get the number of tokens currently taken from key's bucket."""
+        async with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                return 0
+            limit = bucket[2]
+            bucket = self._refill(key, limit, window, time.monotonic())
+            return math.ceil(limit - bucket[0])
+    
+    async def reset(self, key: str) -> None:
+        """Reset rate limit for a key."""
+        async with self.lock:
+            self.buckets.pop(key, None)
 
 
 class RedisRateLimiter:
@@ -171,13 +242,30 @@ class RedisRateLimiter:
             logger.error(f"Failed to reset rate limit: {e}")
 
 
-# Global rate limiter instance
+# '<count>/<period>' with an optional ':<algorithm>' suffix, which is ignored here
+_RATE_LIMIT_RE = re.compile(r"^(\d+)/(second|minute|hour|day)(?::[^:]*)?$", re.IGNORECASE)
+_PERIOD_SECONDS = MappingProxyType({
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+})
+
+
+# Global rate limiter instances
 _rate_limiter: Optional[InMemoryRateLimiter | RedisRateLimiter] = None
+_bucket_limiter: Optional[TokenBucketLimiter] = None
 
 
-def get_rate_limiter() -> InMemoryRateLimiter | RedisRateLimiter:
-    """Get or create rate limiter instance."""
-    global _rate_limiter
+def get_rate_limiter(algorithm: str = "sliding") -> InMemoryRateLimiter | RedisRateLimiter | TokenBucketLimiter:
+    """Get or create the rate limiter instance for an algorithm."""
+    global _rate_limiter, _bucket_limiter
+    
+    if algorithm == "bucket":
+        # Token buckets are kept in memory whatever RATE_LIMIT_STORAGE says
+        if _bucket_limiter is None:
+            _bucket_limiter = TokenBucketLimiter()
+        return _bucket_limiter
     
     if _rate_limiter is None:
         if config.RATE_LIMIT_STORAGE == "redis":
@@ -188,32 +276,38 @@ def get_rate_limiter() -> InMemoryRateLimiter | RedisRateLimiter:
     return _rate_limiter
 
 
+@lru_cache(maxsize=128)
+def parse_rate_limit_spec(limit_str: str) -> tuple[int, int, str]:
+    """
+    Parse rate limit string like '10/hour', '100/minute:sliding' or '10/second:bucket'.
+    
+    Returns:
+        (limit, window_seconds, algorithm)
+    """
+    limit_str, _, algorithm = limit_str.partition(":")
+    algorithm = algorithm.lower() or "sliding"
+    if algorithm not in ("sliding", "bucket"):
+        raise ValueError(f"Invalid rate limit algorithm: {algorithm}")
+    
+    limit, window = parse_rate_limit(limit_str)
+    return limit, window, algorithm
+
+
+@lru_cache(maxsize=128)
 def parse_rate_limit(limit_str: str) -> tuple[int, int]:
     """
     Parse rate limit string like '10/hour' or '100/minute'.
     
+    An algorithm suffix (see parse_rate_limit_spec) is accepted and ignored.
+    
     Returns:
         (limit, window_seconds)
     """
-    parts = limit_str.split("/")
-    if len(parts) != 2:
+    match = _RATE_LIMIT_RE.match(limit_str)
+    if match is None:
         raise ValueError(f"Invalid rate limit format: {limit_str}")
     
-    limit = int(parts[0])
-    period = parts[1].lower()
-    
-    period_map = {
-        "second": 1,
-        "minute": 60,
-        "hour": 3600,
-        "day": 86400,
-    }
-    
-    window = period_map.get(period)
-    if window is None:
-        raise ValueError(f"Invalid period: {period}")
-    
-    return limit, window
+    return int(match.group(1)), _PERIOD_SECONDS[match.group(2).lower()]
 
 
 def get_client_identifier(request: Request) -> str:
@@ -253,9 +347,6 @@ async def rate_limit_middleware(request: Request, call_next: Callable) -> Respon
     if request.url.path in ["/health", "/metrics", "/api/health"]:
         return await call_next(request)
     
-    # Get rate limiter
-    limiter = get_rate_limiter()
-    
     # Get client identifier
     client_id = get_client_identifier(request)
     
@@ -272,11 +363,14 @@ async def rate_limit_middleware(request: Request, call_next: Callable) -> Respon
     
     # Parse limit
     try:
-        limit, window = parse_rate_limit(limit_str)
+        limit, window, algorithm = parse_rate_limit_spec(limit_str)
     except ValueError as e:
         logger.error(f"Invalid rate limit configuration: {e}")
         return await call_next(request)
     
+    # Get rate limiter
+    limiter = get_rate_limiter(algorithm)
+    
     # Check rate limit
     is_allowed, retry_after = await limiter.is_allowed(client_id, limit, window)
     
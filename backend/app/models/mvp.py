@@ -55,7 +55,7 @@ class MVP(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: Optional[int] = Field(default=None, foreign_key="user.id", index=True)
     name: str = Field(index=True)
-    status: MVPState = Field(default=MVPState.CREATED)
+    status: MVPState = Field(default=MVPState.CREATED, index=True)
     idea_summary: Optional[str] = None
     deployment_url: Optional[str] = None
     token_id: Optional[str] = None
@@ -1,7 +1,6 @@
 from crewai.tools import tool
 import httpx
 import os
-import asyncio
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -45,15 +44,10 @@ def post_to_moltbook(title: str, content: str, submolt: str = "lablab") -> str:
                     code = verification.get("verification_code")
                     challenge = verification.get("challenge_text")
                     
+                    from app.services.ai_runtime._bg_loop import run_sync
                     from app.services.ai_runtime.llm_router import LLMRouter
                     router = LLMRouter()
-                    try:
-                        loop = asyncio.get_event_loop()
-                    except RuntimeError:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        
-                    answer_data = loop.run_until_complete(
+                    answer_data = run_sync(
                         router.execute_llm_call(
                             task_id="IDEATION",
                             prompt=f"Solve this math challenge and return ONLY the number (exactly 2 decimals): {challenge}"
@@ -224,6 +224,16 @@ http_requests_in_progress = Gauge(
     registry=metrics_registry
 )
 
+# ============================================================================
+# SSE METRICS
+# ============================================================================
+
+sse_messages_dropped_total = Counter(
+    "eido_sse_messages_dropped_total",
+    "Total number of SSE messages dropped because a subscriber queue was full",
+    registry=metrics_registry
+)
+
 # ============================================================================
 # RATE LIMITING METRICS
 # ============================================================================
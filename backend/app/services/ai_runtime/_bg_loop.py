@@ -0,0 +1,38 @@
+"""Background event loop for running coroutines from synchronous tool code."""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional
+
+# Seconds a synchronous caller waits for its coroutine before giving up
+DEFAULT_TIMEOUT = 60
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop shared by all synchronous tool runs."""
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="crewai-tool-loop", daemon=True).start()
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, Any], timeout: float = DEFAULT_TIMEOUT) -> Any:
+    """
+    Run a coroutine on the shared background loop and block until it finishes.
+    
+    On timeout the coroutine is cancelled before the error is raised, so it
+    can't keep running (and having side effects) after the caller gave up.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
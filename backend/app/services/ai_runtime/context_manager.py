@@ -7,6 +7,7 @@ from ...config.settings import config
 from ...logger import get_logger
 from ...models.mvp import MVP
 from ...agent.context_optimizer import ContextOptimizer
+from .llm_router import estimate_tokens
 
 logger = get_logger(__name__)
 
@@ -21,8 +22,8 @@ class ContextManager:
         self.optimizer = ContextOptimizer()
     
     def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count (rough approximation: ~1.3 tokens per word)."""
-        return int(len(text.split()) * 1.3)
+        """Estimate token count (rough approximation: ~4 characters per token)."""
+        return estimate_tokens(text)
     
     def build_stage_context(self, stage_name: str) -> Dict[str, Any]:
         """
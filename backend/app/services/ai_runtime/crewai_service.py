@@ -1,6 +1,5 @@
 """CrewAI Service - manages CrewAI crew initialization and execution."""
 
-import json
 import asyncio
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
@@ -9,9 +8,10 @@ from crewai import Agent, Task, Crew, Process
 from ...config.settings import config
 from ...logger import get_logger
 from ...exceptions import EidoException
+from ...utils import fast_json
 from ...agent.context_optimizer import ContextOptimizer
 from .llm_router import LLMRouter, TaskType
-from .skill_loader import SkillLoader
+from .skill_loader import get_skill_loader
 from .e2b_sandbox import E2BSandboxManager
 from ...integrations.deployment import HereNowClient
 from ...integrations.surge import SurgeTokenManager
@@ -47,7 +47,7 @@ class CrewAIService:
         self.mvp_id = mvp_id
         self.router = llm_router or LLMRouter()
         self.verbose = verbose
-        self.skill_loader = SkillLoader()
+        self.skill_loader = get_skill_loader()
         self.sandbox_manager: Optional[E2BSandboxManager] = None
         self.agents: Dict[str, Agent] = {}
         self.context_optimizer = ContextOptimizer()
@@ -575,7 +575,8 @@ class CrewAIService:
                 import re
                 match = re.search(r'(\{.*\})', raw_str, re.DOTALL)
                 if match:
-                    output_data = json.loads(match.group(1))
+                    payload = match.group(1)
+                    output_data = fast_json.loads(payload)
                 else:
                     output_data = {"raw_output": raw_str}
             else:
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import os
 import shutil
 import subprocess
@@ -20,6 +20,8 @@ class E2BSandboxManager:
         self.sandbox: Optional[Sandbox] = None
         self.is_local = not bool(self.api_key)
         self.workspace_path = "/home/user/workspace" if not self.is_local else os.path.abspath("./workspace")
+        # Set in __enter__ once we know whether files.write creates parent dirs
+        self._files_write_autocreates = False
 
     def __enter__(self):
         if self.is_local:
@@ -30,6 +32,7 @@ class E2BSandboxManager:
                 self.sandbox = Sandbox(connection_config=ConnectionConfig(api_key=self.api_key))
                 # Initialize workspace
                 self.sandbox.commands.run(f"mkdir -p {self.workspace_path}")
+                self._files_write_autocreates = self._probe_files_write_autocreates()
                 logger.info(f"E2B Sandbox created: {self.sandbox.id}")
             except Exception as e:
                 logger.warning(f"Failed to create E2B Sandbox: {e}. Falling back to local mode.")
@@ -45,6 +48,15 @@ class E2BSandboxManager:
             self.sandbox.close()
             self.sandbox = None
 
+    def _probe_files_write_autocreates(self) -> bool:
+        """Check once whether files.write creates missing parent directories."""
+        try:
+            self.sandbox.files.write("/tmp/.eido_probe/x", "y")
+            return True
+        except Exception as e:
+            logger.debug(f"E2B files.write does not create parent dirs: {e}")
+            return False
+
     def write_file(self, relative_path: str, content: str) -> bool:
         """Write a file to the sandbox workspace."""
         if self.is_local:
@@ -62,8 +74,10 @@ class E2BSandboxManager:
                 raise RuntimeError("Sandbox not initialized")
             
             full_path = f"{self.workspace_path}/{relative_path.lstrip('/')}"
-            dir_path = "/".join(full_path.split("/")[:-1])
-            self.sandbox.commands.run(f"mkdir -p {dir_path}")
+            if not self._files_write_autocreates:
+                # Older SDKs need the parent directory to exist first
+                dir_path = full_path.rsplit("/", 1)[0]
+                self.sandbox.commands.run(f"mkdir -p {dir_path}")
             
             try:
                 self.sandbox.files.write(full_path, content)
@@ -72,13 +86,19 @@ class E2BSandboxManager:
                 logger.error(f"E2B write_file failed: {e}")
                 return False
 
-    def read_file(self, relative_path: str) -> Optional[str]:
-        """Read a file from the sandbox workspace."""
+    def read_file(self, relative_path: str, binary: bool = False) -> Optional[Union[str, bytes]]:
+        """Read a file from the sandbox workspace.
+
+        With ``binary=True`` the raw bytes are returned without UTF-8 decoding.
+        """
         if self.is_local:
             full_path = os.path.join(self.workspace_path, relative_path.lstrip("/"))
             if not os.path.exists(full_path):
                 return None
             try:
+                if binary:
+                    with open(full_path, "rb") as f:
+                        return f.read()
                 with open(full_path, "r", encoding="utf-8") as f:
                     return f.read()
             except Exception as e:
@@ -90,6 +110,8 @@ class E2BSandboxManager:
             
             full_path = f"{self.workspace_path}/{relative_path.lstrip('/')}"
             try:
+                if binary:
+                    return self.sandbox.files.read(full_path, format="bytes")
                 return self.sandbox.files.read(full_path)
             except Exception as e:
                 logger.error(f"E2B read_file failed: {e}")
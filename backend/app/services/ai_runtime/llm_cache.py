@@ -0,0 +1,129 @@
+"""LLM Cache - exact-match response cache in front of provider calls."""
+
+import json
+import hashlib
+from typing import Dict, Any, Optional, Type
+from pydantic import BaseModel
+
+from ...config.settings import config
+from ...logger import get_logger
+from ...utils import fast_json
+from ...utils.ttl_cache import LRUTTLCache
+
+logger = get_logger(__name__)
+
+
+def make_cache_key(
+    model: str,
+    prompt: str,
+    schema: Optional[Type[BaseModel]] = None,
+    system_prompt: Optional[str] = None,
+) -> str:
+    """Build a stable cache key from the model, prompts and response schema."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "system": system_prompt,
+            "prompt": prompt,
+            # Module-qualified so same-named models from different modules don't collide
+            "schema": f"{schema.__module__}.{schema.__qualname__}" if schema else None,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class InMemoryLLMCache:
+    """In-memory LRU cache with per-entry TTL, local to one worker process."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.store = LRUTTLCache(max_entries=max_entries)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None if missing/expired."""
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        """Store value under key for ttl seconds, evicting the oldest entry when full."""
+        self.store.set(key, value, ttl)
+
+    async def clear(self) -> None:
+        """Drop all cached entries."""
+        self.store.clear()
+
+
+class RedisLLMCache:
+    """Redis-backed LLM cache shared between workers."""
+
+    def __init__(self):
+        self.redis_client = None
+        self._initialize_redis()
+
+    def _initialize_redis(self):
+        """Initialize Redis connection."""
+        try:
+            import redis.asyncio as redis
+            self.redis_client = redis.from_url(
+                config.REDIS_URL,
+                encoding="utf-8",
+                decode_responses=True
+            )
+            logger.info("Redis LLM cache initialized")
+        except ImportError:
+            logger.warning("redis package not installed, LLM cache disabled")
+            self.redis_client = None
+        except Exception as e:
+            logger.error(f"Failed to connect to Redis: {e}")
+            self.redis_client = None
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None on miss or Redis failure."""
+        if not self.redis_client:
+            return None
+
+        try:
+            raw = await self.redis_client.get(f"llm_cache:{key}")
+            if not raw:
+                return None
+            return fast_json.loads(raw)
+        except Exception as e:
+            logger.error(f"Redis LLM cache get failed: {e}")
+            return None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        """Store value under key for ttl seconds."""
+        if not self.redis_client:
+            return
+
+        try:
+            await self.redis_client.set(f"llm_cache:{key}", json.dumps(value), ex=ttl)
+        except Exception as e:
+            logger.error(f"Redis LLM cache set failed: {e}")
+
+    async def clear(self) -> None:
+        """Drop all cached entries."""
+        if not self.redis_client:
+            return
+
+        try:
+            async for redis_key in self.redis_client.scan_iter("llm_cache:*"):
+                await self.redis_client.delete(redis_key)
+        except Exception as e:
+            logger.error(f"Failed to clear Redis LLM cache: {e}")
+
+
+# Global cache instance shared by all routers
+_llm_cache: Optional[InMemoryLLMCache | RedisLLMCache] = None
+
+
+def get_llm_cache() -> InMemoryLLMCache | RedisLLMCache:
+    """Get or create the LLM cache instance."""
+    global _llm_cache
+
+    if _llm_cache is None:
+        if config.LLM_CACHE_STORAGE == "redis":
+            _llm_cache = RedisLLMCache()
+        else:
+            _llm_cache = InMemoryLLMCache(max_entries=config.LLM_CACHE_MAX_ENTRIES)
+
+    return _llm_cache
@@ -1,23 +1,105 @@
 """LLM Clients - provider-specific implementations (OpenAI, Anthropic)."""
 
 import asyncio
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Type
 
 from ...config.settings import config
 from ...logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import openai
+    _HAS_OPENAI = True
+except ImportError:
+    openai = None
+    _HAS_OPENAI = False
+
+try:
+    import anthropic
+    _HAS_ANTHROPIC = True
+except ImportError:
+    anthropic = None
+    _HAS_ANTHROPIC = False
+
+# Fixed stub payloads returned when a provider has no API key configured.
+_STUB_CONTENT_OPENAI = '{"status": "success", "message": "Stubbed response"}'
+_STUB_CONTENT_IDEATION = '{"name": "EIDO-Test", "idea": "AI SaaS for Hackathons", "score": 9.2, "feasibility": "High", "status": "active"}'
+_STUB_CONTENT_ARCHITECTURE = '{"name": "EIDO-Arch", "stack": "Next.js, FastAPI, SQLite", "components": ["Auth", "API", "DB"], "status": "planning"}'
+_STUB_CONTENT_ANTHROPIC = '{"status": "success", "message": "Stubbed Anthropic response"}'
+_STUB_CONTENT_GROQ = '{"status": "success", "message": "Stubbed Groq response"}'
+_STUB_CONTENT_GEMINI = '{"status": "success", "message": "Stubbed Gemini response"}'
+_STUB_CONTENT_OLLAMA = '{"status": "success", "message": "Stubbed Ollama response"}'
+_STUB_OUTPUT_TOKENS = 50
+
+# model -> "<model>-stub", filled lazily so repeated stub calls skip the f-string
+_STUB_MODEL_NAMES: Dict[str, str] = {}
+
+
+def _stub_payload(content: str, prompt: str, model: str) -> Dict[str, Any]:
+    """Build a stub completion result around a precomputed content string."""
+    stub_model = _STUB_MODEL_NAMES.get(model)
+    if stub_model is None:
+        stub_model = _STUB_MODEL_NAMES.setdefault(model, f"{model}-stub")
+    return {
+        "content": content,
+        # ~4 characters per token, as in llm_router.estimate_tokens
+        "input_tokens": (len(prompt) + 3) // 4,
+        "output_tokens": _STUB_OUTPUT_TOKENS,
+        "model": stub_model,
+    }
+
+
+def _chat_messages(prompt: str, messages: Optional[List[Dict[str, str]]] = None) -> List[Dict[str, str]]:
+    """Return the explicit chat messages if given, else the prompt as a single user turn."""
+    return messages or [{"role": "user", "content": prompt}]
+
+
+def _anthropic_request(prompt: str, messages: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+    """Build Anthropic messages kwargs; system turns go in the top-level `system` field."""
+    chat = _chat_messages(prompt, messages)
+    request: Dict[str, Any] = {"messages": [m for m in chat if m["role"] != "system"]}
+    system = "\n\n".join(m["content"] for m in chat if m["role"] == "system")
+    if system:
+        request["system"] = system
+    return request
+
+
+async def _stream_chat_completion(client, prompt: str, model: str, **kwargs) -> AsyncIterator[str]:
+    """Yield content deltas from an OpenAI-compatible streaming chat completion."""
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=_chat_messages(prompt, kwargs.get("messages")),
+        temperature=kwargs.get("temperature", 0.7),
+        max_tokens=kwargs.get("max_tokens", 2000),
+        stream=True,
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
 
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
     
     @abstractmethod
     async def complete(self, prompt: str, model: str, **kwargs) -> Dict[str, Any]:
-        """Execute text completion/chat."""
+        """
+        Execute text completion/chat.
+        
+        A `messages` kwarg (list of role/content dicts) replaces the default
+        single user turn built from `prompt`, e.g. to continue a conversation.
+        """
         pass
 
+    async def stream(self, prompt: str, model: str, **kwargs) -> AsyncIterator[str]:
+        """Stream completion text as it is generated (single chunk by default)."""
+        response = await self.complete(prompt, model, **kwargs)
+        yield response["content"]
+
 
 class OpenAIClient(LLMClient):
     """Client for OpenAI models."""
@@ -29,10 +111,10 @@ class OpenAIClient(LLMClient):
             self.stub_mode = True
         else:
             self.stub_mode = False
-            try:
-                import openai
-                self.client = openai.AsyncOpenAI(api_key=self.api_key)
-            except ImportError:
+            if _HAS_OPENAI:
+                # No SDK retries in any client: LLMRouter._execute_llm_call is the only retry layer
+                self.client = openai.AsyncOpenAI(api_key=self.api_key, max_retries=0)
+            else:
                 logger.warning("openai package not installed, using stub mode")
                 self.stub_mode = True
 
@@ -43,7 +125,7 @@ class OpenAIClient(LLMClient):
         try:
             response = await self.client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=_chat_messages(prompt, kwargs.get("messages")),
                 temperature=kwargs.get("temperature", 0.7),
                 max_tokens=kwargs.get("max_tokens", 2000),
             )
@@ -58,22 +140,27 @@ class OpenAIClient(LLMClient):
             logger.error(f"OpenAI API Error: {e}")
             raise
 
+    async def stream(self, prompt: str, model: str, **kwargs) -> AsyncIterator[str]:
+        if self.stub_mode:
+            async for delta in super().stream(prompt, model, **kwargs):
+                yield delta
+            return
+        
+        async for delta in _stream_chat_completion(self.client, prompt, model, **kwargs):
+            yield delta
+
     async def _stub_response(self, prompt: str, model: str) -> Dict[str, Any]:
         """Return a mock JSON response for development."""
         await asyncio.sleep(0.5)
         # Check for keywords to return appropriate mock JSON
-        content = '{"status": "success", "message": "Stubbed response"}'
-        if "ideation" in prompt.lower() or "test" in prompt.lower():
-            content = '{"name": "EIDO-Test", "idea": "AI SaaS for Hackathons", "score": 9.2, "feasibility": "High", "status": "active"}'
-        elif "architecture" in prompt.lower():
-            content = '{"name": "EIDO-Arch", "stack": "Next.js, FastAPI, SQLite", "components": ["Auth", "API", "DB"], "status": "planning"}'
+        prompt_lower = prompt.lower()
+        content = _STUB_CONTENT_OPENAI
+        if "ideation" in prompt_lower or "test" in prompt_lower:
+            content = _STUB_CONTENT_IDEATION
+        elif "architecture" in prompt_lower:
+            content = _STUB_CONTENT_ARCHITECTURE
             
-        return {
-            "content": content,
-            "input_tokens": len(prompt.split()) * 1.3,
-            "output_tokens": 50,
-            "model": f"{model}-stub"
-        }
+        return _stub_payload(content, prompt, model)
 
 
 class AnthropicClient(LLMClient):
@@ -86,10 +173,9 @@ class AnthropicClient(LLMClient):
             self.stub_mode = True
         else:
             self.stub_mode = False
-            try:
-                import anthropic
-                self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
-            except ImportError:
+            if _HAS_ANTHROPIC:
+                self.client = anthropic.AsyncAnthropic(api_key=self.api_key, max_retries=0)
+            else:
                 logger.warning("anthropic package not installed, using stub mode")
                 self.stub_mode = True
 
@@ -100,7 +186,7 @@ class AnthropicClient(LLMClient):
         try:
             response = await self.client.messages.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                **_anthropic_request(prompt, kwargs.get("messages")),
                 max_tokens=kwargs.get("max_tokens", 2000),
                 temperature=kwargs.get("temperature", 0.7),
             )
@@ -115,15 +201,27 @@ class AnthropicClient(LLMClient):
             logger.error(f"Anthropic API Error: {e}")
             raise
 
+    async def stream(self, prompt: str, model: str, **kwargs) -> AsyncIterator[str]:
+        if self.stub_mode:
+            async for delta in super().stream(prompt, model, **kwargs):
+                yield delta
+            return
+        
+        stream = await self.client.messages.create(
+            model=model,
+            **_anthropic_request(prompt, kwargs.get("messages")),
+            max_tokens=kwargs.get("max_tokens", 2000),
+            temperature=kwargs.get("temperature", 0.7),
+            stream=True,
+        )
+        async for event in stream:
+            if event.type == "content_block_delta" and getattr(event.delta, "text", None):
+                yield event.delta.text
+
     async def _stub_response(self, prompt: str, model: str) -> Dict[str, Any]:
         """Return a mock JSON response for development."""
         await asyncio.sleep(0.5)
-        return {
-            "content": '{"status": "success", "message": "Stubbed Anthropic response"}',
-            "input_tokens": len(prompt.split()) * 1.3,
-            "output_tokens": 50,
-            "model": f"{model}-stub"
-        }
+        return _stub_payload(_STUB_CONTENT_ANTHROPIC, prompt, model)
 
 
 class GroqClient(LLMClient):
@@ -136,13 +234,13 @@ class GroqClient(LLMClient):
             self.stub_mode = True
         else:
             self.stub_mode = False
-            try:
-                import openai
+            if _HAS_OPENAI:
                 self.client = openai.AsyncOpenAI(
                     api_key=self.api_key,
-                    base_url="https://api.groq.com/openai/v1"
+                    base_url="https://api.groq.com/openai/v1",
+                    max_retries=0,
                 )
-            except ImportError:
+            else:
                 logger.warning("openai package not installed (needed for Groq), using stub mode")
                 self.stub_mode = True
 
@@ -153,7 +251,7 @@ class GroqClient(LLMClient):
         try:
             response = await self.client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=_chat_messages(prompt, kwargs.get("messages")),
                 temperature=kwargs.get("temperature", 0.7),
                 max_tokens=kwargs.get("max_tokens", 2000),
             )
@@ -168,15 +266,19 @@ class GroqClient(LLMClient):
             logger.error(f"Groq API Error: {e}")
             raise
 
+    async def stream(self, prompt: str, model: str, **kwargs) -> AsyncIterator[str]:
+        if self.stub_mode:
+            async for delta in super().stream(prompt, model, **kwargs):
+                yield delta
+            return
+        
+        async for delta in _stream_chat_completion(self.client, prompt, model, **kwargs):
+            yield delta
+
     async def _stub_response(self, prompt: str, model: str) -> Dict[str, Any]:
         """Return a mock JSON response for development."""
         await asyncio.sleep(0.5)
-        return {
-            "content": '{"status": "success", "message": "Stubbed Groq response"}',
-            "input_tokens": len(prompt.split()) * 1.3,
-            "output_tokens": 50,
-            "model": f"{model}-stub"
-        }
+        return _stub_payload(_STUB_CONTENT_GROQ, prompt, model)
 
 
 class GeminiClient(LLMClient):
@@ -189,13 +291,13 @@ class GeminiClient(LLMClient):
             self.stub_mode = True
         else:
             self.stub_mode = False
-            try:
-                import openai
+            if _HAS_OPENAI:
                 self.client = openai.AsyncOpenAI(
                     api_key=self.api_key,
-                    base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+                    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+                    max_retries=0,
                 )
-            except ImportError:
+            else:
                 logger.warning("openai package not installed (needed for Gemini), using stub mode")
                 self.stub_mode = True
 
@@ -206,7 +308,7 @@ class GeminiClient(LLMClient):
         try:
             response = await self.client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=_chat_messages(prompt, kwargs.get("messages")),
                 temperature=kwargs.get("temperature", 0.7),
                 max_tokens=kwargs.get("max_tokens", 2000),
             )
@@ -221,15 +323,19 @@ class GeminiClient(LLMClient):
             logger.error(f"Gemini API Error: {e}")
             raise
 
+    async def stream(self, prompt: str, model: str, **kwargs) -> AsyncIterator[str]:
+        if self.stub_mode:
+            async for delta in super().stream(prompt, model, **kwargs):
+                yield delta
+            return
+        
+        async for delta in _stream_chat_completion(self.client, prompt, model, **kwargs):
+            yield delta
+
     async def _stub_response(self, prompt: str, model: str) -> Dict[str, Any]:
         """Return a mock JSON response for development."""
         await asyncio.sleep(0.5)
-        return {
-            "content": '{"status": "success", "message": "Stubbed Gemini response"}',
-            "input_tokens": len(prompt.split()) * 1.3,
-            "output_tokens": 50,
-            "model": f"{model}-stub"
-        }
+        return _stub_payload(_STUB_CONTENT_GEMINI, prompt, model)
 
 
 class OllamaClient(LLMClient):
@@ -238,13 +344,13 @@ class OllamaClient(LLMClient):
     def __init__(self):
         self.base_url = config.OLLAMA_BASE_URL
         self.stub_mode = False
-        try:
-            import openai
+        if _HAS_OPENAI:
             self.client = openai.AsyncOpenAI(
                 api_key="ollama",  # Ollama doesn't need a real key
-                base_url=self.base_url
+                base_url=self.base_url,
+                max_retries=0,
             )
-        except ImportError:
+        else:
             logger.warning("openai package not installed (needed for Ollama), using stub mode")
             self.stub_mode = True
 
@@ -258,7 +364,7 @@ class OllamaClient(LLMClient):
         try:
             response = await self.client.chat.completions.create(
                 model=clean_model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=_chat_messages(prompt, kwargs.get("messages")),
                 temperature=kwargs.get("temperature", 0.7),
                 max_tokens=kwargs.get("max_tokens", 2000),
             )
@@ -273,36 +379,66 @@ class OllamaClient(LLMClient):
             logger.error(f"Ollama API Error: {e}")
             raise
 
+    async def stream(self, prompt: str, model: str, **kwargs) -> AsyncIterator[str]:
+        if self.stub_mode:
+            async for delta in super().stream(prompt, model, **kwargs):
+                yield delta
+            return
+        
+        clean_model = model.replace("ollama/", "") if model.startswith("ollama/") else model
+        async for delta in _stream_chat_completion(self.client, prompt, clean_model, **kwargs):
+            yield delta
+
     async def _stub_response(self, prompt: str, model: str) -> Dict[str, Any]:
         await asyncio.sleep(0.5)
-        return {
-            "content": '{"status": "success", "message": "Stubbed Ollama response"}',
-            "input_tokens": len(prompt.split()) * 1.3,
-            "output_tokens": 50,
-            "model": f"{model}-stub"
-        }
+        return _stub_payload(_STUB_CONTENT_OLLAMA, prompt, model)
+
+
+# One shared instance (and HTTP connection pool) per provider client class and
+# event loop: the SDK clients' httpx pools are bound to the loop that first used
+# them, and LLM calls run on both the app loop and the background tool loop
+_provider_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Type[LLMClient], LLMClient]]" = weakref.WeakKeyDictionary()
+_provider_clients_lock = threading.Lock()
+
+
+def _provider_client(client_cls: Type[LLMClient]) -> LLMClient:
+    """Return the running loop's client for a provider, constructing it on first use."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop to bind a pool to, so don't share this one
+        return client_cls()
+    
+    with _provider_clients_lock:
+        clients = _provider_clients.get(loop)
+        if clients is None:
+            clients = _provider_clients[loop] = {}
+        client = clients.get(client_cls)
+        if client is None:
+            client = clients[client_cls] = client_cls()
+    return client
 
 
 def get_llm_client(model: str) -> LLMClient:
-    """Factory function to get appropriate LLM client."""
+    """Factory function to get the LLM client for a model's provider, shared per event loop."""
     model_lower = model.lower()
     
     # Check for Ollama (local) models — prefix 'ollama/' in model name
     if model_lower.startswith("ollama/") or model_lower.startswith("ollama_"):
-        return OllamaClient()
+        return _provider_client(OllamaClient)
     
     # Check for Gemini specific model names
     if "gemini" in model_lower:
-        return GeminiClient()
+        return _provider_client(GeminiClient)
     
     # Check for Groq/Llama model names - route to Groq if key is available
     if any(m in model_lower for m in ["llama", "mixtral", "gemma", "qwen", "deepseek"]) and config.GROQ_API_KEY:
-        return GroqClient()
+        return _provider_client(GroqClient)
     
     if "gpt" in model_lower:
-        return OpenAIClient()
+        return _provider_client(OpenAIClient)
     elif "claude" in model_lower:
-        return AnthropicClient()
+        return _provider_client(AnthropicClient)
     else:
         # Default to OpenAI
-        return OpenAIClient()
+        return _provider_client(OpenAIClient)
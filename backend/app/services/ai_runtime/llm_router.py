@@ -1,76 +1,212 @@
 """LLM Router - routes tasks to appropriate LLM models with cost tracking."""
 
+import re
 import json
+import time
+import random
+import sys
 import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, Any, Optional, Type
-from pydantic import BaseModel
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple, Type, Union
+from pydantic import BaseModel, ValidationError as PydanticValidationError
 
 from ...config.settings import config
 from ...logger import get_logger
 from ...exceptions import EidoException
+from .llm_cache import get_llm_cache, make_cache_key
+from .llm_clients import LLMClient, get_llm_client
 
 logger = get_logger(__name__)
 
+
+class _LeaderCancelled(Exception):
+    """Set on a shared in-flight call whose leader was cancelled, so joiners retry."""
+
+
+# Upper bound (seconds) on the full-jitter backoff between LLM call attempts
+_MAX_RETRY_BACKOFF = 30
+
+# Correction sent after a response fails validation
+_REPAIR_INSTRUCTIONS = (
+    "Your previous response was not valid JSON for the required schema.\n\n"
+    "Validation errors:\n{errors}\n\n"
+    "JSON schema:\n{schema}\n\n"
+    "Return ONLY the corrected JSON object, with no explanation or code fences."
+)
+# Standalone repair prompt for a different repair model. It carries only the bad
+# output and the correction instead of resending the full prompt.
+_REPAIR_PROMPT_TEMPLATE = "Previous response:\n{previous}\n\n" + _REPAIR_INSTRUCTIONS
+# Characters of the failed response echoed back in a repair prompt
+_REPAIR_PREVIOUS_MAX_CHARS = 2000
+
+try:
+    import tiktoken
+    _HAS_TIKTOKEN = True
+except ImportError:
+    tiktoken = None
+    _HAS_TIKTOKEN = False
+
+
+@lru_cache(maxsize=32)
+def _get_encoder(model: str):
+    """Return a cached BPE encoder for a model (cl100k_base when unknown)."""
+    if not _HAS_TIKTOKEN:
+        return None
+    try:
+        encoding_name = tiktoken.encoding_name_for_model(model.split("/")[-1])
+    except KeyError:
+        encoding_name = "cl100k_base"
+    for name in dict.fromkeys((encoding_name, "cl100k_base")):
+        try:
+            return tiktoken.get_encoding(name)
+        except Exception as e:
+            logger.warning("tiktoken encoding {} unavailable: {}", name, e, encoding=name)
+    return None
+
+
+# Token counts of recently seen texts, keyed by (model, blake2b digest of the text).
+# Prompts and system messages repeat a lot (retries, CrewAI agents, the litellm callback).
+_TOKEN_COUNT_CACHE: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+_TOKEN_COUNT_CACHE_SIZE = 4096
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) without building a word list."""
+    return (len(text) + 3) // 4
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count tokens with the model's BPE encoder, falling back to estimate_tokens."""
+    if not text:
+        return 0
+    encoder = _get_encoder(model)
+    if encoder is None:
+        return estimate_tokens(text)
+    
+    key = (model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+    count = _TOKEN_COUNT_CACHE.get(key)
+    if count is not None:
+        _TOKEN_COUNT_CACHE.move_to_end(key)
+        return count
+    count = len(encoder.encode(text, disallowed_special=()))
+    _TOKEN_COUNT_CACHE[key] = count
+    if len(_TOKEN_COUNT_CACHE) > _TOKEN_COUNT_CACHE_SIZE:
+        _TOKEN_COUNT_CACHE.popitem(last=False)
+    return count
+
+
+@lru_cache(maxsize=256)
+def _resolve_cost_per_token(model: str) -> Optional[Tuple[float, float]]:
+    """Resolve (input, output) USD cost per token for a model name, or None if unknown.
+
+    An exact (case-insensitive) key wins; otherwise the longest MODEL_COSTS key
+    contained in the model name is used, e.g. "groq/llama3-8b" -> "llama3-8b"
+    and "openai/gpt-4o-mini" -> "gpt-4o-mini" rather than "gpt-4".
+    """
+    model_lower = model.lower()
+    rates = _COST_PER_TOKEN.get(model_lower)
+    if rates is not None:
+        return rates
+    match = _COST_KEY_RE.search(model_lower)
+    return _COST_PER_TOKEN[match.group()] if match else None
+
+
+@lru_cache(maxsize=None)
+def get_response_json_schema(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Return the (cached) JSON schema for a response model."""
+    return schema.model_json_schema()
+
+
+def _extract_fenced_block(text: str) -> Optional[str]:
+    """Return the content of the first ``` / ```json fenced block, or None if there is none."""
+    start = text.find("```")
+    if start == -1:
+        return None
+    start += 3
+    if text.startswith("json", start):
+        start += 4
+    end = text.find("```", start)
+    if end == -1:
+        return None
+    return text[start:end].strip()
+
+
+try:
+    import json_repair
+    _HAS_JSON_REPAIR = True
+except ImportError:
+    json_repair = None
+    _HAS_JSON_REPAIR = False
+
+
 # Global counters to track usage across the entire application lifetime
 # This captures both direct router calls and CrewAI agent calls via litellm
 _GLOBAL_TOTAL_TOKENS = 0
 _GLOBAL_TOTAL_COST = 0.0
+_GLOBAL_USAGE_LOCK = threading.Lock()
+# Responses whose token usage had to be counted locally because the provider did not report it
+_TOKENIZER_FALLBACK_COUNT = 0
+# Token counting for the litellm callback runs here, off the completion path
+_USAGE_TRACKING_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-usage")
+
+
+def _record_tokenizer_fallback() -> None:
+    """Count a response that needed local token counting (tracks provider usage regressions)."""
+    global _TOKENIZER_FALLBACK_COUNT
+    with _GLOBAL_USAGE_LOCK:
+        _TOKENIZER_FALLBACK_COUNT += 1
+
 
 def _litellm_success_callback(kwargs, completion_response, start_time, end_time):
     """Global callback for litellm to track usage from any source."""
+    try:
+        _USAGE_TRACKING_POOL.submit(_track_litellm_usage, kwargs, completion_response)
+    except RuntimeError as e:
+        # Executor already shut down (interpreter exit)
+        logger.debug("Usage tracking skipped: {}", e)
+
+
+def _track_litellm_usage(kwargs, completion_response):
+    """Count tokens and cost for one litellm completion and add them to the global totals."""
     global _GLOBAL_TOTAL_TOKENS, _GLOBAL_TOTAL_COST
     try:
-        usage = completion_response.get('usage', {})
+        usage = completion_response.get('usage', {}) or {}
         tokens = usage.get('total_tokens', 0)
-        
-        # If tokens are 0 (common with Groq), use our tokenizer fallback logic
-        if tokens == 0:
-            model = kwargs.get('model', 'unknown')
-            # litellm expects a provider-prefixed model name
-            token_model = model if '/' in model else f"groq/{model}"
-            
-            from litellm import get_num_tokens
-            prompt = kwargs.get('messages', [{}])[-1].get('content', '')
-            response_text = completion_response.get('choices', [{}])[0].get('message', {}).get('content', '')
-            
-            try:
-                tokens = get_num_tokens(prompt, model=token_model) + get_num_tokens(response_text, model=token_model)
-            except:
-                tokens = int((len(prompt.split()) + len(response_text.split())) * 1.3)
-        
-        _GLOBAL_TOTAL_TOKENS += tokens
-        
-        # Estimate cost globally using the router's logic
-        # We can use a temporary router instance or access the map directly
-        # Since this is a standalone function, we look up the costs manually
+        input_tokens = usage.get('prompt_tokens')
+        output_tokens = usage.get('completion_tokens')
         model = kwargs.get('model', 'unknown')
-        costs = {"input": 0.0, "output": 0.0} # Default to zero
         
-        # Direct lookup in the costs map (we'll make the map a class attribute)
-        for model_key, cost_values in LLMRouter.MODEL_COSTS.items():
-            if model_key in model.lower():
-                costs = cost_values
-                break
-        
-        # Simple split estimation: input ~prompt, output ~completion
-        # Since we only have total_tokens, we approximate 50/50 split for cost if not specified
-        # or we could parse messages but that's overkill. For free models, it's 0 anyway.
-        input_tokens = len(kwargs.get('messages', [{}])[-1].get('content', '').split()) * 1.3
-        output_tokens = tokens - input_tokens
+        # Fast path: the provider reported the full usage split, so no tokenizer work
+        if not (tokens and input_tokens is not None and output_tokens is not None):
+            # Missing or partial usage (common with Groq): count locally
+            _record_tokenizer_fallback()
+            prompt = kwargs.get('messages', [{}])[-1].get('content', '')
+            input_tokens = count_tokens(prompt, model)
+            if tokens == 0:
+                response_text = completion_response.get('choices', [{}])[0].get('message', {}).get('content', '')
+                tokens = input_tokens + count_tokens(response_text, model)
+            output_tokens = tokens - input_tokens
         
-        cost = ((input_tokens / 1000) * costs["input"]) + ((max(0, output_tokens) / 1000) * costs["output"])
-        _GLOBAL_TOTAL_COST += cost
+        # Unknown models default to zero cost
+        input_rate, output_rate = _resolve_cost_per_token(model) or (0.0, 0.0)
+        cost = input_tokens * input_rate + max(0, output_tokens) * output_rate
+        with _GLOBAL_USAGE_LOCK:
+            _GLOBAL_TOTAL_TOKENS += tokens
+            _GLOBAL_TOTAL_COST += cost
+            total_tokens = _GLOBAL_TOTAL_TOKENS
         
-        logger.info(f"Captured {tokens} tokens from litellm call ({model}). Total global: {_GLOBAL_TOTAL_TOKENS}")
+        logger.info(
+            "Captured {} tokens from litellm call ({}). Total global: {}",
+            tokens, model, total_tokens,
+            model=model, tokens=tokens, cost=cost,
+        )
     except Exception as e:
-        logger.warning(f"Usage tracking callback failed: {e}")
+        logger.warning("Usage tracking callback failed: {}", e)
 
 # Register the callback with litellm
 try:
@@ -80,7 +216,7 @@ try:
 except ImportError:
     logger.warning("litellm not installed, global usage tracking disabled")
 except Exception as e:
-    logger.warning(f"Failed to register litellm callback: {e}")
+    logger.warning("Failed to register litellm callback: {}", e)
 
 
 class TaskType(str, Enum):
@@ -143,35 +279,75 @@ class LLMRouter:
     def __init__(self):
         # We still keep local counts for instance-specific tracking if needed,
         # but usage stats will report global totals by default.
-        self.total_tokens_used = 0
-        self.total_cost = 0.0
-        # Task type to model mapping from config
-        self.TASK_MODEL_MAP = {
-            TaskType.IDEATION: config.IDEATION_LLM_MODEL,
-            TaskType.ARCHITECTURE: config.ARCHITECTURE_LLM_MODEL,
-            TaskType.BUILDING: config.BUILDING_LLM_MODEL,
-            TaskType.DEPLOYMENT: config.DEPLOYMENT_LLM_MODEL,
-            TaskType.TOKENIZATION: config.TOKENIZATION_LLM_MODEL,
-            TaskType.SUMMARY: config.SUMMARY_LLM_MODEL,
+        # (tokens, cost) is swapped as one tuple so readers never see a torn pair.
+        self._usage: Tuple[int, float] = (0, 0.0)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # [input_tokens, output_tokens] per (model, task) for the usage breakdown
+        self._usage_breakdown: Dict[Tuple[str, str], List[int]] = {}
+        # In-flight calls by request key, so identical concurrent calls share one result
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Task type to model mapping from config, keyed by the plain string value
+        # so routing is a str-keyed dict lookup (e.g. "IDEATION" -> IDEATION_LLM_MODEL).
+        # Model names are interned: they key the client, usage and cost
+        # caches, and identical objects short-circuit those lookups.
+        self._task_model_map: Dict[str, str] = {
+            task.value: sys.intern(getattr(config, f"{task.value}_LLM_MODEL")) for task in TaskType
         }
     
-    def get_model_for_task(self, task_type: TaskType) -> str:
-        """Get the appropriate model for a task type."""
-        model = self.TASK_MODEL_MAP.get(task_type, config.DEFAULT_LLM_MODEL)
-        logger.info(f"Routing {task_type.value} to model: {model}")
-        return model
+    @classmethod
+    def warmup(cls, schemas: Tuple[Type[BaseModel], ...] = ()) -> None:
+        """
+        Pay one-off setup costs before the first LLM call instead of during it.
+        
+        Loads the tokenizer for every configured task model and builds the
+        validator and JSON schema for each known response schema.
+        """
+        models = {config.DEFAULT_LLM_MODEL, *cls()._task_model_map.values()}
+        for model in models:
+            _get_encoder(model)
+        for schema in schemas:
+            try:
+                if not schema.__pydantic_complete__:
+                    schema.model_rebuild(force=True)
+                get_response_json_schema(schema)
+            except Exception as e:
+                logger.warning("Failed to warm up response schema {}: {}", schema.__name__, e)
+        logger.info("LLM router warmed up ({} models, {} schemas)", len(models), len(schemas))
+    
+    def _client(self, model: str) -> LLMClient:
+        """Return the provider client for a model on the running event loop."""
+        # Not cached on the router: a router may be used from more than one
+        # loop, and get_llm_client already shares clients per loop
+        return get_llm_client(model)
+    
+    @property
+    def total_tokens_used(self) -> int:
+        return self._usage[0]
+    
+    @property
+    def total_cost(self) -> float:
+        return self._usage[1]
+    
+    def _record_usage(self, model: str, task_key: str, input_tokens: int, output_tokens: int, cost: float) -> None:
+        """Add to the local usage totals and the per-(model, task) breakdown."""
+        used_tokens, used_cost = self._usage
+        self._usage = (used_tokens + input_tokens + output_tokens, used_cost + cost)
+        counters = self._usage_breakdown.get((model, task_key))
+        if counters is None:
+            counters = self._usage_breakdown[(model, task_key)] = [0, 0]
+        counters[0] += input_tokens
+        counters[1] += output_tokens
+    
+    def get_model_for_task(self, task_type: Union[TaskType, str]) -> str:
+        """Get the appropriate model for a task type (enum member or its string value)."""
+        # TaskType is a str enum, so members hash and compare equal to their values
+        return self._task_model_map.get(task_type) or sys.intern(config.DEFAULT_LLM_MODEL)
     
     def estimate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """Estimate cost for token usage."""
-        costs = self.MODEL_COSTS.get(model, {"input": 0.01, "output": 0.03})
-        for key in self.MODEL_COSTS:
-            if key in model.lower():
-                costs = self.MODEL_COSTS[key]
-                break
-                
-        input_cost = (input_tokens / 1000) * costs["input"]
-        output_cost = (output_tokens / 1000) * costs["output"]
-        return input_cost + output_cost
+        input_rate, output_rate = _resolve_cost_per_token(model) or _DEFAULT_COST_PER_TOKEN
+        return input_tokens * input_rate + output_tokens * output_rate
 
     async def execute_llm_call(
         self,
@@ -179,123 +355,297 @@ class LLMRouter:
         prompt: str,
         response_schema: Optional[Type[BaseModel]] = None,
         max_retries: Optional[int] = None,
+        system_prompt: Optional[str] = None,
     ) -> LLMResponse:
         """
         Execute LLM call with routing and tracking.
+        
+        Put large, stable context (instructions, skills, project state) in
+        `system_prompt` and the per-call request in `prompt`: the system turn is
+        sent first, so providers can serve it from their prompt-prefix cache.
+        
+        Concurrent calls with the same (model, prompts, schema) are coalesced:
+        the first one runs, the others wait for and share its result.
         """
         model = self.get_model_for_task(task_type)
+        request_key = make_cache_key(model, prompt, response_schema, system_prompt)
+        
+        while True:
+            inflight = self._inflight.get(request_key)
+            if inflight is None:
+                break
+            logger.debug("Joining in-flight LLM call for {}", task_type.value, task=task_type.value, model=model)
+            try:
+                response = await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                # The call we joined was cancelled, not failed: retry, leading if nobody else has
+                continue
+            # Usage was already accounted to the call that did the work
+            return response.model_copy(update={"token_usage": 0, "cost_estimate": 0.0})
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[request_key] = future
+        try:
+            response = await self._execute_llm_call(
+                task_type, model, prompt, request_key, response_schema, max_retries, system_prompt
+            )
+        except asyncio.CancelledError:
+            # Cancelling the future itself would cancel every joiner along with us
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark as retrieved so nobody-waiting doesn't log "exception never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            self._inflight.pop(request_key, None)
+
+    async def _execute_llm_call(
+        self,
+        task_type: TaskType,
+        model: str,
+        prompt: str,
+        request_key: str,
+        response_schema: Optional[Type[BaseModel]],
+        max_retries: Optional[int],
+        system_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        """Run one LLM call through the cache, retries and validation."""
         max_attempts = max_retries or config.MAX_LLM_RETRIES
         
+        # Identical (model, prompt, schema) requests are served from the cache
+        cache = get_llm_cache() if config.LLM_CACHE_ENABLED else None
+        cache_key = request_key if cache else None
+        if cache:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.info("LLM cache hit for {}", task_type.value, task=task_type.value, model=model)
+                # A cached answer costs nothing this time around
+                return LLMResponse.model_construct(**{**cached, "token_usage": 0, "cost_estimate": 0.0})
+            self.cache_misses += 1
+        
         # We use a custom retry wrapper to handle validation errors vs API errors
         last_exception = None
+        # Hard wall-clock budget shared by all attempts and backoff sleeps
+        deadline = time.monotonic() + config.LLM_TOTAL_TIMEOUT_SECONDS
+        
+        # Validation retries switch to a short repair prompt (and optionally a cheaper model);
+        # the original prompt is never modified
+        base_messages: Optional[List[Dict[str, str]]] = None
+        if system_prompt:
+            base_messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ]
+        call_model, call_prompt, call_messages = model, prompt, base_messages
         
         for attempt in range(1, max_attempts + 1):
             try:
-                logger.info(f"LLM call attempt {attempt}/{max_attempts} for {task_type.value}")
+                logger.debug(
+                    "LLM call attempt {}/{} for {}", attempt, max_attempts, task_type.value,
+                    attempt=attempt, max_attempts=max_attempts, task=task_type.value, model=call_model,
+                )
                 
-                # Execute the actual call
-                response_data = await self._raw_llm_call(model, prompt)
+                # Execute the actual call, bounded by what is left of the budget
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError("LLM call budget exhausted")
+                response_data = await asyncio.wait_for(
+                    self._raw_llm_call(call_model, call_prompt, call_messages), timeout=remaining
+                )
                 
                 raw_output = response_data['content']
                 # Try to get token usage from provider response
                 input_tokens = response_data.get('input_tokens')
                 output_tokens = response_data.get('output_tokens')
-                # Groq does not return token counts – fall back to litellm tokenizer
-                # litellm expects a provider-prefixed model name (e.g. "groq/llama-3.3-70b-versatile")
-                token_model = model if model.startswith('groq/') else f"groq/{model}"
+                # Groq does not return token counts – count locally with the BPE encoder
+                if input_tokens is None or output_tokens is None:
+                    _record_tokenizer_fallback()
                 if input_tokens is None:
-                    try:
-                        from litellm import get_num_tokens
-                        input_tokens = get_num_tokens(prompt, model=token_model)
-                    except Exception:
-                        # Simple approximation as last resort
-                        input_tokens = int(len(prompt.split()) * 1.3)
+                    if call_messages:
+                        input_tokens = sum(count_tokens(m["content"], call_model) for m in call_messages)
+                    else:
+                        input_tokens = count_tokens(call_prompt, call_model)
                 if output_tokens is None:
-                    try:
-                        from litellm import get_num_tokens
-                        output_tokens = get_num_tokens(raw_output, model=token_model)
-                    except Exception:
-                        output_tokens = int(len(raw_output.split()) * 1.3)
+                    output_tokens = count_tokens(raw_output, call_model)
                 total_tokens = int(input_tokens + output_tokens)
-                logger.debug(f"Token counts - input: {input_tokens}, output: {output_tokens}, total: {total_tokens}")
                 
-                cost = self.estimate_cost(model, int(input_tokens), int(output_tokens))
+                cost = self.estimate_cost(call_model, int(input_tokens), int(output_tokens))
                 
                 # Track totals
-                self.total_tokens_used += total_tokens
-                self.total_cost += cost
+                self._record_usage(call_model, task_type.value, int(input_tokens), int(output_tokens), cost)
                 
                 # Validate against schema if provided
                 parsed_output = None
                 if response_schema:
                     try:
                         parsed_output = self._validate_json_response(raw_output, response_schema)
-                        logger.info("JSON response validated successfully")
                     except Exception as e:
-                        logger.warning(f"JSON validation failed on attempt {attempt}: {e}")
+                        logger.warning(
+                            "JSON validation failed on attempt {}: {}", attempt, e,
+                            attempt=attempt, task=task_type.value, model=call_model,
+                        )
                         if attempt < max_attempts:
-                            # Modify prompt slightly for retry if it failed validation
-                            prompt += f"\n\nIMPORTANT: Your previous response failed validation with error: {str(e)}. Please ensure your response is ONLY valid JSON matching the required schema."
+                            repair_model = config.REPAIR_LLM_MODEL or model
+                            previous = raw_output[:_REPAIR_PREVIOUS_MAX_CHARS]
+                            errors = str(e)
+                            schema_json = json.dumps(get_response_json_schema(response_schema))
+                            if repair_model == model:
+                                # Same model: continue the conversation so the original prompt
+                                # stays an identical prefix and hits the provider's prompt cache
+                                call_prompt = prompt
+                                call_messages = [
+                                    *(base_messages or [{"role": "user", "content": prompt}]),
+                                    {"role": "assistant", "content": previous},
+                                    {"role": "user", "content": _REPAIR_INSTRUCTIONS.format(
+                                        errors=errors, schema=schema_json,
+                                    )},
+                                ]
+                            else:
+                                call_prompt = _REPAIR_PROMPT_TEMPLATE.format(
+                                    previous=previous, errors=errors, schema=schema_json,
+                                )
+                                call_messages = None
+                            call_model = repair_model
                             continue
                         else:
                             raise LLMRouterError(f"Failed to get valid JSON after {max_attempts} attempts: {e}")
                 
-                return LLMResponse(
-                    model_used=model,
+                # One INFO record per completed call, with the details as structured fields
+                logger.info(
+                    "LLM call for {} completed on attempt {} ({} tokens)", task_type.value, attempt, total_tokens,
+                    task=task_type.value, model=call_model, attempt=attempt,
+                    input_tokens=int(input_tokens), output_tokens=int(output_tokens), cost=cost,
+                )
+                
+                # Fields are already validated/typed here, so skip a second validation pass
+                response = LLMResponse.model_construct(
+                    model_used=call_model,
                     token_usage=total_tokens,
                     cost_estimate=cost,
                     raw_output=raw_output,
-                    parsed_output=parsed_output.dict() if parsed_output else None,
+                    parsed_output=parsed_output.model_dump() if parsed_output else None,
                 )
+                if cache:
+                    await cache.set(cache_key, response.model_dump(), config.LLM_CACHE_TTL_SECONDS)
+                return response
                 
             except Exception as e:
-                logger.error(f"LLM call failed on attempt {attempt}: {e}")
+                logger.error(
+                    "LLM call failed on attempt {}: {}", attempt, e,
+                    attempt=attempt, task=task_type.value, model=model,
+                )
                 last_exception = e
                 if attempt == max_attempts:
                     break
-                # Exponential backoff for retries
-                await asyncio.sleep(2 ** attempt)
+                # Full-jitter exponential backoff so concurrent failures don't retry in lockstep
+                backoff = random.uniform(0, min(2 ** attempt, _MAX_RETRY_BACKOFF))
+                if time.monotonic() + backoff >= deadline:
+                    logger.warning(
+                        "LLM call budget of {}s exhausted after {} attempts",
+                        config.LLM_TOTAL_TIMEOUT_SECONDS, attempt, task=task_type.value, model=model,
+                    )
+                    break
+                await asyncio.sleep(backoff)
+        
+        raise LLMRouterError(f"LLM call failed after {attempt} attempts: {last_exception!r}")
+
+    async def execute_llm_batch(
+        self,
+        calls: List[Tuple[Any, ...]],
+        max_concurrent: Optional[int] = None,
+    ) -> List[Union[LLMResponse, BaseException]]:
+        """
+        Execute several LLM calls concurrently.
+        
+        Args:
+            calls: (task_type, prompt) or (task_type, prompt, response_schema) tuples
+            max_concurrent: Cap on in-flight calls (defaults to MAX_CONCURRENT_LLM_CALLS)
+        
+        Returns:
+            Results in input order; a failed call yields its exception instead
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or config.MAX_CONCURRENT_LLM_CALLS)
+        
+        async def _guarded(task_type: TaskType, prompt: str, response_schema: Optional[Type[BaseModel]] = None):
+            async with semaphore:
+                return await self.execute_llm_call(task_type, prompt, response_schema)
         
-        raise LLMRouterError(f"LLM call failed after {max_attempts} attempts: {last_exception}")
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((Exception)), # We filter specifically in the clients
-        reraise=True
-    )
-    async def _raw_llm_call(self, model: str, prompt: str) -> Dict[str, Any]:
-        """Execute raw API call via clients with exponential backoff."""
-        from .llm_clients import get_llm_client
+        return await asyncio.gather(*(_guarded(*call) for call in calls), return_exceptions=True)
+
+    async def stream_llm_call(self, task_type: TaskType, prompt: str) -> AsyncIterator[Tuple[str, int]]:
+        """
+        Stream an LLM call, yielding (delta_text, output_tokens_so_far).
         
-        client = get_llm_client(model)
+        Tokens are counted per delta as they arrive rather than re-encoding the
+        full response at the end; usage is recorded once the stream completes.
+        """
+        model = self.get_model_for_task(task_type)
+        client = self._client(model)
+        output_tokens = 0
+        async for delta in client.stream(prompt, model):
+            output_tokens += count_tokens(delta, model)
+            yield delta, output_tokens
+        
+        input_tokens = count_tokens(prompt, model)
+        self._record_usage(
+            model, task_type.value, input_tokens, output_tokens,
+            self.estimate_cost(model, input_tokens, output_tokens),
+        )
+
+    async def _raw_llm_call(
+        self, model: str, prompt: str, messages: Optional[List[Dict[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a single raw API call via the model's client.
+        
+        This is a single attempt: the clients and their SDKs don't retry, and
+        failures are retried (with backoff and the overall deadline) by
+        _execute_llm_call only.
+        """
         try:
-            return await client.complete(prompt, model)
+            return await self._client(model).complete(prompt, model, messages=messages)
         except Exception as e:
-            logger.error(f"API Client Error: {e}")
+            logger.error("API Client Error: {}", e, model=model)
             raise
 
     def _validate_json_response(self, raw_output: str, schema: Type[BaseModel]) -> BaseModel:
         """Helper to find and parse JSON in LLM response."""
         # Sometimes LLMs wrap JSON in backticks
         json_str = raw_output.strip()
-        if "```json" in json_str:
-            json_str = json_str.split("```json")[1].split("```")[0].strip()
-        elif "```" in json_str:
-            json_str = json_str.split("```")[1].split("```")[0].strip()
+        fenced = _extract_fenced_block(json_str)
+        if fenced is not None:
+            json_str = fenced
             
         try:
-            data = json.loads(json_str)
-            return schema(**data)
-        except json.JSONDecodeError as e:
-            # Fallback: try to find anything that looks like a JSON block
-            import re
-            match = re.search(r'\{.*\}', json_str, re.DOTALL)
-            if match:
+            # Parse and validate in one pass straight into the model
+            return schema.model_validate_json(json_str)
+        except PydanticValidationError as e:
+            if not any(err["type"] == "json_invalid" for err in e.errors()):
+                raise ValueError(f"Schema validation failed: {e}")
+            # Fallback: the outermost {...} span, sliced out without a regex scan
+            start, end = json_str.find("{"), json_str.rfind("}")
+            if start != -1 and end > start:
+                try:
+                    return schema.model_validate_json(json_str[start:end + 1])
+                except PydanticValidationError:
+                    pass
+            # Last local attempt before the caller pays for another LLM round-trip:
+            # repair trailing commas, stray prose, unquoted keys, etc.
+            if _HAS_JSON_REPAIR:
                 try:
-                    data = json.loads(match.group())
-                    return schema(**data)
-                except:
+                    repaired = json_repair.loads(json_str)
+                    if isinstance(repaired, dict) and repaired:
+                        parsed = schema.model_validate(repaired)
+                        logger.info("LLM JSON response repaired locally")
+                        return parsed
+                except Exception:
                     pass
             raise ValueError(f"Invalid JSON format: {e}")
         except Exception as e:
@@ -304,7 +654,40 @@ class LLMRouter:
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics. Returns global totals to include CrewAI agents."""
         # Aggregate local and global to be safe, but global should cover both
+        local_tokens, local_cost = self._usage
+        # Read the global pair under the same lock the tracking thread writes it with
+        with _GLOBAL_USAGE_LOCK:
+            global_tokens, global_cost = _GLOBAL_TOTAL_TOKENS, _GLOBAL_TOTAL_COST
+            tokenizer_fallbacks = _TOKENIZER_FALLBACK_COUNT
+        # Single pass over the (model, task) counters for the per-model/per-task views
+        per_model: Dict[str, int] = {}
+        per_task: Dict[str, int] = {}
+        input_total = output_total = 0
+        for (model, task_key), (input_tokens, output_tokens) in self._usage_breakdown.items():
+            tokens = input_tokens + output_tokens
+            per_model[model] = per_model.get(model, 0) + tokens
+            per_task[task_key] = per_task.get(task_key, 0) + tokens
+            input_total += input_tokens
+            output_total += output_tokens
         return {
-            "total_tokens_used": max(_GLOBAL_TOTAL_TOKENS, self.total_tokens_used),
-            "total_cost": round(max(_GLOBAL_TOTAL_COST, self.total_cost), 4),
+            "total_tokens_used": max(global_tokens, local_tokens),
+            "total_cost": round(max(global_cost, local_cost), 4),
+            "input_tokens": input_total,
+            "output_tokens": output_total,
+            "per_model_tokens": per_model,
+            "per_task_tokens": per_task,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "tokenizer_fallbacks": tokenizer_fallbacks,
         }
+
+
+# Per-token (input, output) rates keyed by lowercased MODEL_COSTS entry
+_COST_PER_TOKEN: Dict[str, Tuple[float, float]] = {
+    key.lower(): (costs["input"] / 1000, costs["output"] / 1000)
+    for key, costs in LLMRouter.MODEL_COSTS.items()
+}
+# All cost keys in one alternation, longest first so the most specific key wins
+_COST_KEY_RE = re.compile("|".join(re.escape(key) for key in sorted(_COST_PER_TOKEN, key=len, reverse=True)))
+# Rates for models missing from MODEL_COSTS ($0.01 / $0.03 per 1K tokens)
+_DEFAULT_COST_PER_TOKEN: Tuple[float, float] = (0.01 / 1000, 0.03 / 1000)
@@ -1,5 +1,7 @@
 """OpenClaw Service - manages OpenClaw tool execution via SafeToolExecutor."""
 
+import asyncio
+from collections import deque
 from typing import Dict, Any, List, Optional
 
 from ...logger import get_logger
@@ -7,6 +9,12 @@ from .tool_sandbox import SafeToolExecutor, ToolSandboxError
 
 logger = get_logger(__name__)
 
+# Tools with no side effects; consecutive runs of these can execute concurrently
+READ_ONLY_TOOLS = frozenset({"read_file", "list_directory"})
+
+# Most recent tool executions kept in the execution log
+MAX_EXECUTION_LOG_ENTRIES = 1000
+
 
 class OpenClawService:
     """Manages OpenClaw tool execution with safety constraints."""
@@ -14,7 +22,10 @@ class OpenClawService:
     def __init__(self, mvp_id: int):
         self.mvp_id = mvp_id
         self.tool_executor = SafeToolExecutor(mvp_id)
-        self.execution_log: List[Dict[str, Any]] = []
+        # Bounded to the most recent executions; totals are kept as running counters
+        self.execution_log: "deque[Dict[str, Any]]" = deque(maxlen=MAX_EXECUTION_LOG_ENTRIES)
+        self.successful_executions = 0
+        self.failed_executions = 0
     
     async def execute_tool(
         self,
@@ -46,6 +57,7 @@ class OpenClawService:
                 "result": result,
                 "success": True,
             })
+            self.successful_executions += 1
             
             logger.info(f"Tool '{tool_name}' executed successfully")
             return result
@@ -60,6 +72,7 @@ class OpenClawService:
                 "error": str(e),
                 "success": False,
             })
+            self.failed_executions += 1
             
             raise
     
@@ -68,38 +81,71 @@ class OpenClawService:
         tools: List[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
         """
-        Execute a sequence of tools.
+        Execute a sequence of tools, running independent tools concurrently.
+        
+        If any spec has a 'depends_on' list (indices of earlier specs in
+        `tools`), tools run in dependency layers. Otherwise, consecutive
+        read-only tools run together and every other tool runs alone, in order.
         
         Args:
-            tools: List of tool specifications with 'name' and 'args'
+            tools: List of tool specifications with 'name', 'args' and
+                optionally 'depends_on'
         
         Returns:
-            List of execution results
+            List of execution results, in the order of `tools`
         """
-        results = []
+        results: Dict[int, Dict[str, Any]] = {}
         
-        for tool_spec in tools:
-            tool_name = tool_spec.get("name")
-            tool_args = tool_spec.get("args", {})
-            
-            if not tool_name:
+        for layer in self._plan_tool_layers(tools):
+            outcomes = await asyncio.gather(
+                *(self.execute_tool(tools[i]["name"], tools[i].get("args", {})) for i in layer),
+                return_exceptions=True,
+            )
+            for i, outcome in zip(layer, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Tool sequence failed at '{tools[i]['name']}': {outcome}")
+                    # Abort on first failure
+                    raise outcome
+                results[i] = outcome
+        
+        return [results[i] for i in sorted(results)]
+    
+    def _plan_tool_layers(self, tools: List[Dict[str, Any]]) -> List[List[int]]:
+        """Group tool indices into layers whose tools can run concurrently."""
+        named = []
+        for i, tool_spec in enumerate(tools):
+            if tool_spec.get("name"):
+                named.append(i)
+            else:
                 logger.warning("Skipping tool with no name")
-                continue
-            
-            try:
-                result = await self.execute_tool(tool_name, tool_args)
-                results.append(result)
-            except ToolSandboxError as e:
-                logger.error(f"Tool sequence failed at '{tool_name}': {e}")
-                # Continue with remaining tools or abort?
-                # For now, abort on first failure
-                raise
         
-        return results
+        if any("depends_on" in tools[i] for i in named):
+            depth: Dict[int, int] = {}
+            for i in named:
+                deps = tools[i].get("depends_on") or []
+                for dep in deps:
+                    if dep not in depth:
+                        raise ToolSandboxError(
+                            f"Tool {i} ('{tools[i]['name']}') depends on {dep}, "
+                            f"which is not an earlier named tool"
+                        )
+                depth[i] = 1 + max((depth[dep] for dep in deps), default=-1)
+            layers: List[List[int]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+            for i in named:
+                layers[depth[i]].append(i)
+            return layers
+        
+        layers = []
+        for i in named:
+            if layers and tools[i]["name"] in READ_ONLY_TOOLS and tools[layers[-1][0]]["name"] in READ_ONLY_TOOLS:
+                layers[-1].append(i)
+            else:
+                layers.append([i])
+        return layers
     
     def get_execution_log(self) -> List[Dict[str, Any]]:
-        """Get complete execution log."""
-        return self.execution_log
+        """Get the execution log (most recent MAX_EXECUTION_LOG_ENTRIES executions)."""
+        return list(self.execution_log)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
@@ -107,7 +153,7 @@ class OpenClawService:
         
         return {
             **tool_stats,
-            "total_executions": len(self.execution_log),
-            "successful_executions": sum(1 for log in self.execution_log if log.get("success")),
-            "failed_executions": sum(1 for log in self.execution_log if not log.get("success")),
+            "total_executions": self.successful_executions + self.failed_executions,
+            "successful_executions": self.successful_executions,
+            "failed_executions": self.failed_executions,
         }
@@ -1,11 +1,63 @@
-from typing import Type, Optional, Any
+import asyncio
+from functools import lru_cache
+from typing import Type, Optional, Any, Set
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
+from ...config.settings import config
 from ...integrations.eido_webhook import EidoWebhookClient
 from ...logger import get_logger
+from ...utils.micro_batcher import MicroBatcher
+from ...utils.ttl_cache import LRUTTLCache
+from ._bg_loop import get_loop, run_sync
 
 logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _shared_client() -> EidoWebhookClient:
+    """Webhook client shared by every tool instance."""
+    return EidoWebhookClient()
+
+
+@lru_cache(maxsize=1)
+def _shared_batcher() -> MicroBatcher:
+    """Webhook batcher on the shared tool loop, used when EIDO_WEBHOOK_BATCHING is on."""
+    return MicroBatcher(
+        _shared_client().post_batch,
+        max_batch=config.EIDO_WEBHOOK_BATCH_MAX_SIZE,
+        max_wait_ms=config.EIDO_WEBHOOK_BATCH_MAX_WAIT_MS,
+    )
+
+
+def _log_webhook_failure(future) -> None:
+    """Log the outcome of a queued webhook nobody is waiting on."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Queued Eido webhook failed: {future.exception()}")
+
+
+# Strong references so fire-and-forget webhook tasks are not garbage collected
+_webhook_tasks: Set[asyncio.Task] = set()
+
+
+def _send_in_background(client: EidoWebhookClient, endpoint: str, payload: dict) -> None:
+    """Send a webhook from the shared tool loop without waiting for it; failures are logged."""
+    def _start():
+        if config.EIDO_WEBHOOK_BATCHING:
+            future = _shared_batcher().submit((endpoint, payload))
+        else:
+            future = asyncio.get_running_loop().create_task(client._post(endpoint, payload))
+            _webhook_tasks.add(future)
+            future.add_done_callback(_webhook_tasks.discard)
+        future.add_done_callback(_log_webhook_failure)
+
+    get_loop().call_soon_threadsafe(_start)
+
+
+# Agents often repeat the same search/fetch within a crew run
+_search_cache = LRUTTLCache(max_entries=1024, ttl=300)
+_fetch_cache = LRUTTLCache(max_entries=1024, ttl=300)
+
+
 class MoltbookPostInput(BaseModel):
     """Input for MoltbookPostTool."""
     title: str = Field(..., description="Title of the post")
@@ -16,19 +68,14 @@ class MoltbookPostTool(BaseTool):
     name: str = "post_to_moltbook"
     description: str = "Posts an update or finding to Moltbook. Use this to share progress or research results with the community."
     args_schema: Type[BaseModel] = MoltbookPostInput
-    client: EidoWebhookClient = Field(default_factory=EidoWebhookClient)
+    client: EidoWebhookClient = Field(default_factory=_shared_client)
 
     def _run(self, title: str, content: str, submolt: str = "lablab") -> str:
-        # Wrap the async call
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
+        if config.EIDO_WEBHOOK_BATCHING:
+            _send_in_background(self.client, *self.client.moltbook_post_webhook(title, content, submolt))
+            return f"Moltbook post queued for m/{submolt}."
         try:
-            result = loop.run_until_complete(self.client.post_to_moltbook(title, content, submolt))
+            result = run_sync(self.client.post_to_moltbook(title, content, submolt))
             return f"Successfully posted to Moltbook. Post ID: {result.get('post_id', 'unknown')}"
         except Exception as e:
             logger.error(f"MoltbookPostTool failed: {e}")
@@ -42,21 +89,12 @@ class TelegramNotifyTool(BaseTool):
     name: str = "notify_user"
     description: str = "Sends a notification message to the user via Telegram. Use this to report major milestones or ask for feedback."
     args_schema: Type[BaseModel] = TelegramNotifyInput
-    client: EidoWebhookClient = Field(default_factory=EidoWebhookClient)
+    client: EidoWebhookClient = Field(default_factory=_shared_client)
 
     def _run(self, message: str) -> str:
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-        try:
-            loop.run_until_complete(self.client.send_notification(message))
-            return "Notification sent successfully."
-        except Exception as e:
-            return f"Error sending notification: {str(e)}"
+        # The agent does not need Eido's reply, so don't block it on the round-trip
+        _send_in_background(self.client, *self.client.notification_webhook(message))
+        return "Notification queued."
 
 class WebSearchInput(BaseModel):
     """Input for WebSearchTool."""
@@ -67,24 +105,23 @@ class WebSearchTool(BaseTool):
     name: str = "search_web"
     description: str = "Researches market data and pain points on various platforms. Use EXACT format: search_web({'query': 'your search', 'platform': 'reddit'})"
     args_schema: Type[BaseModel] = WebSearchInput
-    client: EidoWebhookClient = Field(default_factory=EidoWebhookClient)
+    client: EidoWebhookClient = Field(default_factory=_shared_client)
 
     def _run(self, query: str, platform: str = "general") -> str:
         # In a real implementation, this would either call an OpenClaw skill 
         # or use a direct search API like Serper/Tavily.
         # For now, we'll route it through Eido's search capability.
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
+        key = (query, platform)
+        cached = _search_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             # We assume Eido has a search endpoint that proxies to a search engine
             payload = {"type": "search", "query": query, "platform": platform}
-            result = loop.run_until_complete(self.client._post("/search", payload))
-            return str(result.get("results", "No results found."))
+            result = run_sync(self.client._post("/search", payload))
+            output = str(result.get("results", "No results found."))
+            _search_cache.set(key, output)
+            return output
         except Exception as e:
             return f"Error performing web search: {str(e)}"
 
@@ -98,26 +135,27 @@ class WebFetchTool(BaseTool):
     name: str = "web_fetch"
     description: str = "Fetches the content of a specific web page. Use EXACT format: web_fetch({'url': 'https://example.com', 'max_chars': 10000})"
     args_schema: Type[BaseModel] = WebFetchInput
-    client: EidoWebhookClient = Field(default_factory=EidoWebhookClient)
+    client: EidoWebhookClient = Field(default_factory=_shared_client)
 
     def _run(self, url: str, max_chars: int = 10000) -> str:
-        import asyncio
+        key = (url, max_chars)
+        cached = _fetch_cache.get(key)
+        if cached is not None:
+            return cached
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-        try:
-            # Route through Eido's fetch capability
-            payload = {"type": "fetch", "url": url, "max_chars": max_chars}
-            result = loop.run_until_complete(self.client._post("/fetch", payload))
+            # Route through Eido's fetch capability, reading no more than max_chars
+            result = run_sync(self.client.fetch_stream(url, max_chars))
             
             content = result.get("content", "")
             if len(content) > max_chars:
                 content = content[:max_chars] + f"... (truncated from {len(content)} chars)"
+            elif result.get("truncated"):
+                content += f"... (truncated at {max_chars} chars)"
             
-            return content if content else "No content found or URL not accessible."
+            if not content:
+                return "No content found or URL not accessible."
+            _fetch_cache.set(key, content)
+            return content
         except Exception as e:
             return f"Error fetching URL {url}: {str(e)}"
 
@@ -1,13 +1,20 @@
 import os
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from ...logger import get_logger
 from ...exceptions import EidoException
 
 logger = get_logger(__name__)
 
+# libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 class SkillNotFoundError(EidoException):
     """Raised when a specific agent skill definition cannot be found."""
     def __init__(self, role_id: str):
@@ -25,6 +32,7 @@ class SkillProfile:
     description: str
     goal: str
     allowed_tools: List[str] = field(default_factory=list)
+    # Not populated by SkillLoader, so cached profiles don't pin the file text
     raw_content: str = ""
 
 class SkillLoader:
@@ -36,9 +44,32 @@ class SkillLoader:
             self.skills_dir = Path(__file__).parent.parent.parent / "skills"
         else:
             self.skills_dir = Path(skills_dir)
+
+        # role_id -> (SKILL.md mtime_ns, parsed profile)
+        self._cache: Dict[str, Tuple[int, SkillProfile]] = {}
+        # Skill directory name (and its underscore form) -> SKILL.md path
+        self._index: Dict[str, Path] = {}
+        self._build_index()
         
         logger.info(f"SkillLoader initialized with directory: {self.skills_dir}")
 
+    def _build_index(self) -> None:
+        """Scan skills_dir once and index every directory that has a SKILL.md."""
+        index: Dict[str, Path] = {}
+        if self.skills_dir.exists():
+            for d in self.skills_dir.iterdir():
+                skill_file = d / "SKILL.md"
+                if d.is_dir() and skill_file.exists():
+                    index[d.name] = skill_file
+                    index.setdefault(d.name.replace("-", "_"), skill_file)
+        self._index = index
+
+    def _find_skill_file(self, role_id: str) -> Optional[Path]:
+        """Look up the SKILL.md for role_id, accepting either separator style."""
+        # Handle social-manager vs social_manager naming inconsistencies
+        key = role_id.replace("-", "_")
+        return self._index.get(role_id) or self._index.get(key)
+
     def load_skill(self, role_id: str) -> SkillProfile:
         """
         Load and parse a specific skill into a SkillProfile dataclass.
@@ -49,20 +80,21 @@ class SkillLoader:
         Returns:
             SkillProfile object
         """
-        # Handle social-manager vs social_manager naming inconsistencies
-        possible_dirs = [role_id, role_id.replace("_", "-"), role_id.replace("-", "_")]
-        
-        skill_file = None
-        for d in possible_dirs:
-            path = self.skills_dir / d / "SKILL.md"
-            if path.exists():
-                skill_file = path
-                break
+        skill_file = self._find_skill_file(role_id)
+        if not skill_file:
+            # A skill may have been added since the last scan
+            self._build_index()
+            skill_file = self._find_skill_file(role_id)
         
         if not skill_file:
             logger.warning(f"Skill file not found for role_id: {role_id}")
             raise SkillNotFoundError(role_id)
 
+        mtime = skill_file.stat().st_mtime_ns
+        cached = self._cache.get(role_id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         try:
             with open(skill_file, "r", encoding="utf-8") as f:
                 content = f.read()
@@ -71,10 +103,10 @@ class SkillLoader:
             frontmatter = {}
             body = content
             if content.startswith("---"):
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    frontmatter = yaml.safe_load(parts[1])
-                    body = parts[2].strip()
+                frontmatter_text, sep, rest = content[3:].partition("---")
+                if sep:
+                    frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader) or {}
+                    body = rest.strip()
 
             # Create the profile object
             profile = SkillProfile(
@@ -83,7 +115,6 @@ class SkillLoader:
                 description=body, # We use the body as the primary backstory/description
                 goal=frontmatter.get("description", "Contribute to the startup factory."),
                 allowed_tools=frontmatter.get("tools", []),
-                raw_content=content
             )
             
             # If goal (from description frontmatter) is too short or missing, we could extract it
@@ -91,6 +122,7 @@ class SkillLoader:
                 # Fallback: take first sentence of body
                 profile.goal = body.split(".")[0] + "."
 
+            self._cache[role_id] = (mtime, profile)
             logger.info(f"Successfully loaded skill profile for {role_id}")
             return profile
 
@@ -114,10 +146,19 @@ class SkillLoader:
 
     def list_available_skills(self) -> List[str]:
         """List all available skill IDs."""
-        if not self.skills_dir.exists():
-            return []
-        
-        return [
-            d.name for d in self.skills_dir.iterdir() 
-            if d.is_dir() and (d / "SKILL.md").exists()
-        ]
+        return list(dict.fromkeys(path.parent.name for path in self._index.values()))
+
+
+# Global instance, so parsed profiles survive across CrewAIService instances
+_loader_instance: Optional[SkillLoader] = None
+_loader_lock = threading.Lock()
+
+
+def get_skill_loader() -> SkillLoader:
+    """Get or create the global SkillLoader for the default skills directory."""
+    global _loader_instance
+    if _loader_instance is None:
+        with _loader_lock:
+            if _loader_instance is None:
+                _loader_instance = SkillLoader()
+    return _loader_instance
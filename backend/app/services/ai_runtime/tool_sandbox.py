@@ -1,9 +1,11 @@
 """Tool Sandbox - safe execution environment for OpenClaw tools."""
 
 import os
+import stat
+import shlex
 import asyncio
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from ...config.settings import config
@@ -12,6 +14,24 @@ from ...exceptions import EidoException
 
 logger = get_logger(__name__)
 
+# Most bytes kept from each of a command's stdout and stderr
+_MAX_COMMAND_OUTPUT_BYTES = 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+async def _read_capped(stream: asyncio.StreamReader, limit: int) -> Tuple[bytes, bool]:
+    """Read a stream until EOF or limit bytes; returns (data, truncated)."""
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        chunk = await stream.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            return b"".join(chunks), False
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return b"".join(chunks)[:limit], True
+
 
 class ToolSandboxError(EidoException):
     """Raised when tool execution violates safety constraints."""
@@ -26,6 +46,11 @@ class SafeToolExecutor:
         self.mvp_id = mvp_id
         self.invocation_count = 0
         self.allowed_paths = [Path(p).resolve() for p in config.ALLOWED_TOOL_PATHS]
+        # Allowed roots as separator-terminated strings for prefix matching
+        self._allowed_prefixes = tuple(
+            str(p) if str(p).endswith(os.sep) else str(p) + os.sep
+            for p in self.allowed_paths
+        )
         self.max_invocations = config.MAX_TOOL_INVOCATIONS
         self.max_file_size_bytes = config.MAX_FILE_SIZE_MB * 1024 * 1024
         self.timeout = config.TOOL_EXECUTION_TIMEOUT
@@ -33,32 +58,47 @@ class SafeToolExecutor:
     
     def _validate_path(self, path: str) -> Path:
         """Validate path is within allowed directories."""
+        # Resolved on every call: a cached result would miss a directory
+        # that has since been replaced by a symlink pointing elsewhere
         resolved_path = Path(path).resolve()
+        resolved = str(resolved_path)
         
-        # Check if path is within any allowed directory
-        for allowed_path in self.allowed_paths:
-            try:
-                resolved_path.relative_to(allowed_path)
-                return resolved_path
-            except ValueError:
-                continue
+        # Check if path is an allowed directory or lies beneath one
+        if resolved + os.sep in self._allowed_prefixes or resolved.startswith(self._allowed_prefixes):
+            return resolved_path
         
         raise ToolSandboxError(
             f"Path '{path}' is outside allowed directories: {self.allowed_paths}"
         )
     
-    def _validate_file_size(self, path: Path) -> None:
+    def _validate_file_size(self, size: int) -> None:
         """Validate file size is within limits."""
-        if path.exists() and path.is_file():
-            size = path.stat().st_size
-            if size > self.max_file_size_bytes:
-                raise ToolSandboxError(
-                    f"File size {size} bytes exceeds limit of {self.max_file_size_bytes} bytes"
-                )
+        if size > self.max_file_size_bytes:
+            raise ToolSandboxError(
+                f"File size {size} bytes exceeds limit of {self.max_file_size_bytes} bytes"
+            )
+    
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        """Stat path once; None if it does not exist."""
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            return None
     
-    def _validate_command(self, command: str) -> None:
-        """Validate command is in whitelist."""
-        cmd_parts = command.split()
+    def _read_text_bounded(self, path: Path) -> str:
+        """Read a file, never pulling more than the size limit into memory."""
+        with open(path, "rb") as f:
+            data = f.read(self.max_file_size_bytes + 1)
+        # The file may have grown since it was stat'ed
+        self._validate_file_size(len(data))
+        return data.decode("utf-8")
+    
+    def _validate_command(self, command: str) -> List[str]:
+        """Validate command is in whitelist and return its argv."""
+        try:
+            cmd_parts = shlex.split(command)
+        except ValueError as e:
+            raise ToolSandboxError(f"Malformed command: {e}")
         if not cmd_parts:
             raise ToolSandboxError("Empty command")
         
@@ -67,6 +107,7 @@ class SafeToolExecutor:
             raise ToolSandboxError(
                 f"Command '{base_command}' not in whitelist: {self.allowed_commands}"
             )
+        return cmd_parts
     
     def _check_invocation_limit(self) -> None:
         """Check if invocation limit has been reached."""
@@ -127,18 +168,20 @@ class SafeToolExecutor:
             raise ToolSandboxError("Missing 'path' argument")
         
         path = self._validate_path(path_str)
-        self._validate_file_size(path)
+        st = self._stat(path)
         
-        if not path.exists():
+        if st is None:
             raise ToolSandboxError(f"File does not exist: {path}")
         
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ToolSandboxError(f"Path is not a file: {path}")
         
+        self._validate_file_size(st.st_size)
+        
         # Read file with timeout
         try:
             content = await asyncio.wait_for(
-                asyncio.to_thread(path.read_text),
+                asyncio.to_thread(self._read_text_bounded, path),
                 timeout=self.timeout
             )
             
@@ -162,8 +205,14 @@ class SafeToolExecutor:
         
         path = self._validate_path(path_str)
         
-        # Check content size
-        content_size = len(content.encode('utf-8'))
+        # Check content size; every character is at least one UTF-8 byte, so
+        # oversized content can be rejected before encoding it
+        if len(content) > self.max_file_size_bytes:
+            raise ToolSandboxError(
+                f"Content size exceeds limit of {self.max_file_size_bytes} bytes"
+            )
+        data = content.encode('utf-8')
+        content_size = len(data)
         if content_size > self.max_file_size_bytes:
             raise ToolSandboxError(
                 f"Content size {content_size} bytes exceeds limit of {self.max_file_size_bytes} bytes"
@@ -172,7 +221,7 @@ class SafeToolExecutor:
         # Write file with timeout
         try:
             await asyncio.wait_for(
-                asyncio.to_thread(path.write_text, content),
+                asyncio.to_thread(path.write_bytes, data),
                 timeout=self.timeout
             )
             
@@ -190,28 +239,52 @@ class SafeToolExecutor:
         if not command:
             raise ToolSandboxError("Missing 'command' argument")
         
-        self._validate_command(command)
+        argv = self._validate_command(command)
         
-        # Execute command with timeout
+        # Execute command with timeout; no shell, so operators like && or | are
+        # passed to the program as plain arguments
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
+            process = await asyncio.create_subprocess_exec(
+                *argv,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            async def _drain(stream):
+                data, truncated = await _read_capped(stream, _MAX_COMMAND_OUTPUT_BYTES)
+                if truncated and process.returncode is None:
+                    # Stop a runaway command instead of buffering the rest of its output
+                    process.kill()
+                return data, truncated
+            
+            async def _collect():
+                (stdout, out_truncated), (stderr, err_truncated) = await asyncio.gather(
+                    _drain(process.stdout), _drain(process.stderr)
+                )
+                await process.wait()
+                return stdout, out_truncated, stderr, err_truncated
+            
+            stdout, out_truncated, stderr, err_truncated = await asyncio.wait_for(
+                _collect(),
                 timeout=self.timeout
             )
             
+            stdout_text = stdout.decode('utf-8', errors='replace')
+            stderr_text = stderr.decode('utf-8', errors='replace')
+            if out_truncated:
+                stdout_text += f"\n... (output truncated at {_MAX_COMMAND_OUTPUT_BYTES} bytes)"
+            if err_truncated:
+                stderr_text += f"\n... (output truncated at {_MAX_COMMAND_OUTPUT_BYTES} bytes)"
+            
             return {
                 "success": process.returncode == 0,
                 "returncode": process.returncode,
-                "stdout": stdout.decode('utf-8'),
-                "stderr": stderr.decode('utf-8'),
+                "stdout": stdout_text,
+                "stderr": stderr_text,
             }
         except asyncio.TimeoutError:
+            if process.returncode is None:
+                process.kill()
             raise ToolSandboxError(f"Command execution timed out after {self.timeout}s")
     
     async def _execute_list_directory(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -221,11 +294,12 @@ class SafeToolExecutor:
             raise ToolSandboxError("Missing 'path' argument")
         
         path = self._validate_path(path_str)
+        st = self._stat(path)
         
-        if not path.exists():
+        if st is None:
             raise ToolSandboxError(f"Directory does not exist: {path}")
         
-        if not path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise ToolSandboxError(f"Path is not a directory: {path}")
         
         # List directory with timeout
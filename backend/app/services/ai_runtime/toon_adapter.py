@@ -1,11 +1,57 @@
 """TOON Adapter - Abstraction layer for official toon-format library."""
 
 import json
+import functools
+import threading
+from types import ModuleType
 from typing import Any, Dict, Optional, Tuple
 from ...logger import get_logger
+from ...utils.fast_json import orjson, HAS_ORJSON
 
 logger = get_logger(__name__)
 
+# One reusable encoder for the stdlib path; json.dumps builds a new one per
+# call whenever non-default options are passed. ensure_ascii=False matches
+# orjson's output.
+_MIN_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def _dumps_minified(data: Any) -> str:
+    """Minified JSON for the fallback path, via orjson when installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib handle them
+            pass
+    return _MIN_JSON_ENCODER.encode(data)
+
+
+def _dumps_pretty(data: Any) -> str:
+    """Indented JSON, the baseline TOON savings are measured against."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=str)
+
+
+@functools.cache
+def _try_import() -> Optional[ModuleType]:
+    """Import toon_format once per process; None if it is not installed."""
+    try:
+        import toon_format
+        return toon_format
+    except ImportError:
+        logger.warning(
+            "toon-format library not available. Install with: pip install toon-format. "
+            "Falling back to JSON serialization."
+        )
+        return None
+
 
 class ToonAdapter:
     """
@@ -16,32 +62,24 @@ class ToonAdapter:
     def __init__(self):
         self._toon_available = False
         self._encode_func = None
-        self._estimate_savings_func = None
+        self._count_tokens_func = None
         
-        try:
-            import toon_format
-            if hasattr(toon_format, 'encode'):
-                self._encode_func = toon_format.encode
+        toon_format = _try_import()
+        if toon_format is None:
+            return
+        
+        if hasattr(toon_format, 'encode'):
+            self._encode_func = toon_format.encode
+            
+            # count_tokens lets us measure savings on the string we already
+            # encoded; estimate_savings would encode the data a second time
+            if hasattr(toon_format, 'count_tokens'):
+                self._count_tokens_func = toon_format.count_tokens
                 
-                # estimate_savings might not be available in all versions
-                if hasattr(toon_format, 'estimate_savings'):
-                    self._estimate_savings_func = toon_format.estimate_savings
-                else:
-                    # Custom simple estimator if library version doesn't have it
-                    def estimate_savings_fallback(data):
-                        # Rough heuristic: TOON is usually ~30-50% smaller than formatted JSON
-                        return 40.0 
-                    self._estimate_savings_func = estimate_savings_fallback
-                    
-                self._toon_available = True
-                logger.info("TOON library loaded successfully")
-            else:
-                logger.warning("toon-format library found but missing 'encode' function")
-        except ImportError:
-            logger.warning(
-                "toon-format library not available. Install with: pip install toon-format. "
-                "Falling back to JSON serialization."
-            )
+            self._toon_available = True
+            logger.info("TOON library loaded successfully")
+        else:
+            logger.warning("toon-format library found but missing 'encode' function")
     
     def is_available(self) -> bool:
         """Check if TOON library is available."""
@@ -58,21 +96,21 @@ class ToonAdapter:
             TOON-encoded string, or JSON fallback if TOON unavailable
         """
         if not self._toon_available or self._encode_func is None:
-            # Fallback to Minified JSON for token savings
-            try:
-                return json.dumps(data, separators=(',', ':'), default=str)
-            except Exception as e:
-                logger.error("JSON fallback encoding failed: {}", e)
-                return str(data)
+            return self._encode_fallback(data)
         
         try:
             return self._encode_func(data)
         except Exception as e:
             logger.error("TOON encoding failed: {}, falling back to Minified JSON", e)
-            try:
-                return json.dumps(data, separators=(',', ':'), default=str)
-            except Exception:
-                return str(data)
+            return self._encode_fallback(data)
+    
+    def _encode_fallback(self, data: Any) -> str:
+        """Minified JSON (or str() as a last resort) for when TOON is unavailable or fails."""
+        try:
+            return _dumps_minified(data)
+        except Exception as e:
+            logger.error("JSON fallback encoding failed: {}", e)
+            return str(data)
     
     def encode_with_savings(self, data: Any) -> Tuple[str, Optional[float]]:
         """
@@ -83,16 +121,27 @@ class ToonAdapter:
         
         Returns:
             Tuple of (encoded_string, savings_percentage)
-            savings_percentage is None if estimation unavailable
+            savings_percentage is None if estimation unavailable or the
+            data fell back to JSON
         """
-        encoded = self.encode(data)
+        if not self._toon_available or self._encode_func is None:
+            return self._encode_fallback(data), None
+        
+        try:
+            encoded = self._encode_func(data)
+        except Exception as e:
+            logger.error("TOON encoding failed: {}, falling back to Minified JSON", e)
+            return self._encode_fallback(data), None
         
-        if not self._toon_available or self._estimate_savings_func is None:
+        if self._count_tokens_func is None:
             return encoded, None
         
         try:
-            savings = self._estimate_savings_func(data)
-            return encoded, savings
+            json_tokens = self._count_tokens_func(_dumps_pretty(data))
+            if not json_tokens:
+                return encoded, None
+            toon_tokens = self._count_tokens_func(encoded)
+            return encoded, (json_tokens - toon_tokens) / json_tokens * 100
         except Exception as e:
             logger.warning("Token savings estimation failed: {}", e)
             return encoded, None
@@ -118,11 +167,14 @@ class ToonAdapter:
 
 # Global singleton instance
 _adapter_instance: Optional[ToonAdapter] = None
+_adapter_lock = threading.Lock()
 
 
 def get_toon_adapter() -> ToonAdapter:
     """Get or create the global ToonAdapter instance."""
     global _adapter_instance
     if _adapter_instance is None:
-        _adapter_instance = ToonAdapter()
+        with _adapter_lock:
+            if _adapter_instance is None:
+                _adapter_instance = ToonAdapter()
     return _adapter_instance
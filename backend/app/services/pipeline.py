@@ -1,12 +1,13 @@
 """Autonomous pipeline orchestration engine with AI Runtime integration."""
 
 import asyncio
-import hashlib
+import secrets
+import time
 from datetime import datetime
 from typing import Optional
 from sqlmodel import Session, select
 
-from ..models.mvp import MVP, MVPState, is_valid_transition, is_terminal_state
+from ..models.mvp import MVP, MVPState, NON_TERMINAL_STATES, is_valid_transition, is_terminal_state
 from ..models.agent_run import AgentRun
 from ..db import get_session_context
 from ..config.settings import config
@@ -63,11 +64,13 @@ class AutonomousPipeline:
         self.ai_runtime = AIRuntimeFacade(mvp_id)
         self.webhook_client = EidoWebhookClient()
         self.pipeline_start_time = None
+        # Monotonic clock reading at run() start, for elapsed-time checks
+        self._start_monotonic: Optional[float] = None
         self.context_optimizer = ContextOptimizer()
     
     def _generate_correlation_id(self) -> str:
         """Generate unique correlation ID for request tracing."""
-        return hashlib.sha256(f"{self.mvp_id}-{datetime.utcnow().isoformat()}".encode()).hexdigest()[:16]
+        return secrets.token_hex(8)
     
     def _log(self, message: str, level: str = "info", **kwargs):
         """Log with correlation ID."""
@@ -76,12 +79,13 @@ class AutonomousPipeline:
 
     async def _emit_event(self, event_type: str, payload: dict) -> None:
         """Broadcast stage/pipeline events to SSE subscribers."""
-        await sse_manager.broadcast(self.mvp_id, event_type, payload)
+        await sse_manager.broadcast_now(self.mvp_id, event_type, payload)
     
     async def run(self) -> None:
         """Execute the autonomous pipeline with AI Runtime."""
         self._log("Starting autonomous pipeline execution with AI Runtime")
         self.pipeline_start_time = datetime.utcnow()
+        self._start_monotonic = time.monotonic()
         await self._emit_event("pipeline_started", {"mvp_id": self.mvp_id, "status": "started"})
         
         # Track active pipeline
@@ -110,7 +114,7 @@ class AutonomousPipeline:
                 self._transition_state(session, mvp, MVPState.COMPLETED)
                 
                 # Track success metrics
-                pipeline_duration = (datetime.utcnow() - self.pipeline_start_time).total_seconds()
+                pipeline_duration = self._elapsed_seconds()
                 track_mvp_pipeline_duration(pipeline_duration, "completed")
                 track_mvp_pipeline_cost(
                     mvp.total_cost_estimate,
@@ -137,19 +141,7 @@ class AutonomousPipeline:
             else:
                 runtime_limit_exceeded_total.inc()
             
-            with get_session_context() as session:
-                mvp = session.get(MVP, self.mvp_id)
-                if mvp:
-                    mvp.last_error_stage = "cost_or_runtime_limit"
-                    mvp.last_error_message = str(e)
-                    self._transition_state(session, mvp, MVPState.FAILED)
-                    
-                    # Track failure metrics
-                    pipeline_duration = (datetime.utcnow() - self.pipeline_start_time).total_seconds()
-                    track_mvp_pipeline_duration(pipeline_duration, "failed")
-                    mvp_pipeline_failure_total.labels(
-                        reason="limit_exceeded"
-                    ).inc()
+            self._finalize_failure(e, reason="limit_exceeded", error_stage="cost_or_runtime_limit")
             await self._emit_event(
                 "pipeline_failed",
                 {"mvp_id": self.mvp_id, "error_stage": "cost_or_runtime_limit", "error": str(e)},
@@ -159,26 +151,7 @@ class AutonomousPipeline:
         except Exception as e:
             self._log(f"Pipeline execution failed: {str(e)}", level="error")
             
-            with get_session_context() as session:
-                mvp = session.get(MVP, self.mvp_id)
-                if mvp and not is_terminal_state(mvp.status):
-                    mvp.last_error_message = str(e)
-                    mvp.retry_count += 1
-                    
-                    if mvp.retry_count >= config.MAX_AGENT_RETRIES:
-                        self._log(f"Max retries ({config.MAX_AGENT_RETRIES}) exceeded, marking as FAILED")
-                        self._transition_state(session, mvp, MVPState.FAILED)
-                        
-                        # Track failure metrics
-                        pipeline_duration = (datetime.utcnow() - self.pipeline_start_time).total_seconds()
-                        track_mvp_pipeline_duration(pipeline_duration, "failed")
-                        mvp_pipeline_failure_total.labels(
-                            reason="max_retries_exceeded"
-                        ).inc()
-                    else:
-                        self._log(f"Retry count: {mvp.retry_count}/{config.MAX_AGENT_RETRIES}")
-                        session.add(mvp)
-                        session.commit()
+            self._finalize_failure(e, reason="max_retries_exceeded", count_retry=True)
             await self._emit_event(
                 "pipeline_failed",
                 {"mvp_id": self.mvp_id, "error_stage": "pipeline", "error": str(e)},
@@ -188,6 +161,44 @@ class AutonomousPipeline:
             # Decrement active pipeline counter
             mvp_pipeline_active.dec()
     
+    def _finalize_failure(
+        self,
+        error: Exception,
+        reason: str,
+        error_stage: Optional[str] = None,
+        count_retry: bool = False,
+    ) -> None:
+        """
+        Record a failed run on the MVP in one session.
+        
+        With count_retry, the MVP's retry count is bumped and it is only marked
+        FAILED once MAX_AGENT_RETRIES is reached; otherwise it is marked FAILED
+        straight away.
+        """
+        with get_session_context() as session:
+            mvp = session.get(MVP, self.mvp_id)
+            if not mvp or (count_retry and is_terminal_state(mvp.status)):
+                return
+            
+            if error_stage:
+                mvp.last_error_stage = error_stage
+            mvp.last_error_message = str(error)
+            
+            if count_retry:
+                mvp.retry_count += 1
+                if mvp.retry_count < config.MAX_AGENT_RETRIES:
+                    self._log(f"Retry count: {mvp.retry_count}/{config.MAX_AGENT_RETRIES}")
+                    session.add(mvp)
+                    session.commit()
+                    return
+                self._log(f"Max retries ({config.MAX_AGENT_RETRIES}) exceeded, marking as FAILED")
+            
+            self._transition_state(session, mvp, MVPState.FAILED)
+            
+            # Track failure metrics
+            track_mvp_pipeline_duration(self._elapsed_seconds(), "failed")
+            mvp_pipeline_failure_total.labels(reason=reason).inc()
+    
     def _transition_state(self, session: Session, mvp: MVP, new_state: MVPState) -> None:
         """Transition MVP to new state with validation."""
         if not is_valid_transition(mvp.status, new_state):
@@ -220,11 +231,10 @@ class AutonomousPipeline:
         # Check cost limit before stage execution
         self._check_cost_limit(session, mvp)
         
-        # Transition to target state
-        self._transition_state(session, mvp, target_state)
-        
-        # Create agent run record
+        # Create agent run record; it is committed together with the state
+        # transition below rather than in a commit of its own
         started_at = datetime.utcnow()
+        started_monotonic = time.monotonic()
         agent_run = AgentRun(
             mvp_id=self.mvp_id,
             stage=stage_name,
@@ -233,8 +243,9 @@ class AutonomousPipeline:
             started_at=started_at,
         )
         session.add(agent_run)
-        session.commit()
-        session.refresh(agent_run)
+        
+        # Transition to target state
+        self._transition_state(session, mvp, target_state)
         
         try:
             # Execute stage via AI Runtime
@@ -242,7 +253,7 @@ class AutonomousPipeline:
             
             # Mark agent run as completed
             completed_at = datetime.utcnow()
-            duration_ms = int((completed_at - started_at).total_seconds() * 1000)
+            duration_ms = int((time.monotonic() - started_monotonic) * 1000)
             
             if stage_result.success:
                 agent_run.status = "completed"
@@ -327,7 +338,7 @@ class AutonomousPipeline:
             # Mark agent run as failed if not already updated
             if agent_run.status == "running":
                 completed_at = datetime.utcnow()
-                duration_ms = int((completed_at - started_at).total_seconds() * 1000)
+                duration_ms = int((time.monotonic() - started_monotonic) * 1000)
                 
                 agent_run.status = "failed"
                 agent_run.completed_at = completed_at
@@ -377,10 +388,14 @@ class AutonomousPipeline:
             
             raise CostLimitExceededError(mvp.total_cost_estimate, mvp.max_allowed_cost)
     
+    def _elapsed_seconds(self) -> float:
+        """Seconds since run() started."""
+        return time.monotonic() - self._start_monotonic
+    
     def _check_runtime_limit(self) -> None:
         """Check if runtime limit has been exceeded."""
-        if self.pipeline_start_time:
-            elapsed = (datetime.utcnow() - self.pipeline_start_time).total_seconds()
+        if self._start_monotonic is not None:
+            elapsed = self._elapsed_seconds()
             if elapsed >= config.MAX_TOTAL_RUNTIME:
                 self._log(
                     f"Runtime limit exceeded: {elapsed}s >= {config.MAX_TOTAL_RUNTIME}s",
@@ -413,15 +428,16 @@ class AutonomousPipeline:
         await self._execute_stage(session, mvp, "tokenization", MVPState.TOKENIZING)
 
 
+_NON_TERMINAL_STATE_VALUES = [state.value for state in NON_TERMINAL_STATES]
+
+
 async def resume_incomplete_pipelines() -> None:
     """Resume pipelines that were interrupted (crash recovery)."""
     logger.info("Checking for incomplete pipelines to resume")
     
     with get_session_context() as session:
-        # Find all MVPs in non-terminal states
-        from ..models.mvp import NON_TERMINAL_STATES
-        
-        statement = select(MVP).where(MVP.status.in_([state.value for state in NON_TERMINAL_STATES]))
+        # Find all MVPs in non-terminal states; only the id and status are needed
+        statement = select(MVP.id, MVP.status).where(MVP.status.in_(_NON_TERMINAL_STATE_VALUES))
         incomplete_mvps = session.exec(statement).all()
         
         if not incomplete_mvps:
@@ -431,11 +447,11 @@ async def resume_incomplete_pipelines() -> None:
         logger.info(f"Found {len(incomplete_mvps)} incomplete pipelines, resuming...")
         
         # Resume each pipeline
-        for mvp in incomplete_mvps:
-            logger.info(f"Resuming pipeline for MVP {mvp.id} (state: {mvp.status.value})")
+        for mvp_id, status in incomplete_mvps:
+            logger.info(f"Resuming pipeline for MVP {mvp_id} (state: {status.value})")
             try:
-                pipeline = AutonomousPipeline(mvp.id)
+                pipeline = AutonomousPipeline(mvp_id)
                 # Run in background without blocking startup
                 asyncio.create_task(pipeline.run())
             except Exception as e:
-                logger.error(f"Failed to resume pipeline for MVP {mvp.id}: {str(e)}")
+                logger.error(f"Failed to resume pipeline for MVP {mvp_id}: {str(e)}")
@@ -3,6 +3,34 @@ import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from ..config.settings import config
+from ..monitoring.metrics import sse_messages_dropped_total
+from ..utils.fast_json import orjson, HAS_ORJSON
+
+
+def _dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize an event payload to UTF-8 JSON, via orjson when installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib handle them
+            pass
+    payload["timestamp"] = payload["timestamp"].isoformat() + "+00:00"
+    return json.dumps(payload).encode("utf-8")
+
+
+# "event: <type>\ndata: " per event type; the set of types is small and fixed
+_EVENT_PREFIX: Dict[str, bytes] = {}
+
+
+def _event_prefix(event_type: str) -> bytes:
+    """Encoded SSE frame prefix for event_type, built on first use."""
+    prefix = _EVENT_PREFIX.get(event_type)
+    if prefix is None:
+        prefix = _EVENT_PREFIX[event_type] = f"event: {event_type}\ndata: ".encode("utf-8")
+    return prefix
+
 
 class SSEManager:
     """Manages Server-Sent Event (SSE) streams for real-time pipeline updates."""
@@ -10,6 +38,10 @@ class SSEManager:
     def __init__(self):
         self.queues: Dict[int, List[asyncio.Queue]] = {}
         self.app_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Frames waiting for the coalescing window to close, per MVP
+        self._pending: Dict[int, List[bytes]] = {}
+        self._flush_handles: Dict[int, asyncio.TimerHandle] = {}
+        self.coalesce_window = config.SSE_COALESCE_MS / 1000
 
     def set_loop(self, loop: asyncio.AbstractEventLoop):
         self.app_loop = loop
@@ -18,7 +50,8 @@ class SSEManager:
         if mvp_id not in self.queues:
             self.queues[mvp_id] = []
 
-        queue = asyncio.Queue()
+        # Bounded so a slow client cannot grow memory without limit
+        queue = asyncio.Queue(maxsize=config.SSE_QUEUE_MAX)
         self.queues[mvp_id].append(queue)
         return queue
 
@@ -28,25 +61,73 @@ class SSEManager:
             if not self.queues[mvp_id]:
                 del self.queues[mvp_id]
 
+    def _frame(self, event_type: str, data: Any) -> bytes:
+        """Build one encoded SSE frame for an event."""
+        payload = {
+            "timestamp": datetime.utcnow(),
+            "type": event_type,
+            "data": data,
+        }
+        return _event_prefix(event_type) + _dumps_payload(payload) + b"\n\n"
+
+    def _fanout(self, key: int, sse_message: bytes) -> None:
+        """Hand a message to every subscriber of key."""
+        listeners = self.queues.get(key)
+        if not listeners:
+            return
+
+        # Fan out without yielding to the loop once per subscriber; a full
+        # queue drops its oldest message so slow clients lag rather than block
+        for queue in list(listeners):
+            try:
+                queue.put_nowait(sse_message)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait(sse_message)
+                sse_messages_dropped_total.inc()
+
+    def _flush(self, key: int) -> None:
+        """Send the frames buffered for key as one queued message."""
+        handle = self._flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        frames = self._pending.pop(key, None)
+        if frames:
+            # Consecutive frames in one string are still separate SSE events
+            self._fanout(key, b"".join(frames))
+
     async def broadcast(self, mvp_id: Any, event_type: str, data: Any):
+        """Queue an event, coalescing bursts within SSE_COALESCE_MS per MVP."""
         try:
             key = int(mvp_id)
         except (ValueError, TypeError):
             return
 
-        listeners = self.queues.get(key)
-        if not listeners:
+        if not self.queues.get(key):
             return
 
-        payload = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "type": event_type,
-            "data": data,
-        }
-        sse_message = f"event: {event_type}\\ndata: {json.dumps(payload)}\\n\\n"
+        sse_message = self._frame(event_type, data)
+        if self.coalesce_window <= 0:
+            self._fanout(key, sse_message)
+            return
 
-        for queue in list(listeners):
-            await queue.put(sse_message)
+        self._pending.setdefault(key, []).append(sse_message)
+        if key not in self._flush_handles:
+            self._flush_handles[key] = asyncio.get_running_loop().call_later(
+                self.coalesce_window, self._flush, key
+            )
+
+    async def broadcast_now(self, mvp_id: Any, event_type: str, data: Any):
+        """Send an event immediately, after any frames still buffered for the MVP."""
+        try:
+            key = int(mvp_id)
+        except (ValueError, TypeError):
+            return
+
+        if not self.queues.get(key):
+            return
 
+        self._flush(key)
+        self._fanout(key, self._frame(event_type, data))
 
 sse_manager = SSEManager()
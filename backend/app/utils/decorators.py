@@ -1,5 +1,6 @@
 """Common decorators for endpoints and functions."""
 
+import asyncio
 import functools
 import logging
 from typing import Callable
@@ -7,35 +8,43 @@ from typing import Callable
 logger = logging.getLogger(__name__)
 
 
-def log_execution(func: Callable) -> Callable:
-    """Decorator to log function execution time and result."""
+def log_execution_async(func: Callable) -> Callable:
+    """Decorator to log execution and result of a coroutine function."""
     
     @functools.wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        logger.info(f"Executing {func.__name__} with args={args}, kwargs={kwargs}")
+    async def wrapper(*args, **kwargs):
+        # %-style arguments are only formatted if the record is emitted
+        logger.info("Executing %s with args=%r, kwargs=%r", func.__name__, args, kwargs)
         try:
             result = await func(*args, **kwargs)
-            logger.info(f"{func.__name__} completed successfully")
+            logger.info("%s completed successfully", func.__name__)
             return result
         except Exception as e:
-            logger.error(f"{func.__name__} failed: {str(e)}", exc_info=e)
+            logger.error("%s failed: %s", func.__name__, e, exc_info=e)
             raise
     
+    return wrapper
+
+
+def log_execution_sync(func: Callable) -> Callable:
+    """Decorator to log execution and result of a regular function."""
+    
     @functools.wraps(func)
-    def sync_wrapper(*args, **kwargs):
-        logger.info(f"Executing {func.__name__} with args={args}, kwargs={kwargs}")
+    def wrapper(*args, **kwargs):
+        logger.info("Executing %s with args=%r, kwargs=%r", func.__name__, args, kwargs)
         try:
             result = func(*args, **kwargs)
-            logger.info(f"{func.__name__} completed successfully")
+            logger.info("%s completed successfully", func.__name__)
             return result
         except Exception as e:
-            logger.error(f"{func.__name__} failed: {str(e)}", exc_info=e)
+            logger.error("%s failed: %s", func.__name__, e, exc_info=e)
             raise
     
-    # Return async or sync wrapper based on function type
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
-    return sync_wrapper
+    return wrapper
 
 
-import asyncio
+def log_execution(func: Callable) -> Callable:
+    """Decorator to log function execution and result, async or sync."""
+    if asyncio.iscoroutinefunction(func):
+        return log_execution_async(func)
+    return log_execution_sync(func)
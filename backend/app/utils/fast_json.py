@@ -0,0 +1,16 @@
+"""Fast JSON - orjson when it is installed, the stdlib json module otherwise."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, via orjson when installed."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
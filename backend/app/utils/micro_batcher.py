@@ -0,0 +1,76 @@
+"""Micro-batcher - coalesces items submitted on one event loop into small batches."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Sends one batch; returns one result (or exception) per item, in order
+BatchDispatch = Callable[[List[T]], Awaitable[List[Any]]]
+
+
+class MicroBatcher(Generic[T]):
+    """
+    Collects items and hands them to a dispatch coroutine together.
+
+    A batch is flushed once it reaches max_batch items or max_wait_ms after
+    its first item arrived, whichever comes first. Each caller gets a future
+    that resolves with its own item's result (or exception); if dispatch
+    itself raises, every item in the batch fails with that error.
+    """
+
+    def __init__(self, dispatch: BatchDispatch, max_batch: int = 16, max_wait_ms: int = 50):
+        self.dispatch = dispatch
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000
+        self.pending: List[Tuple[T, asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+        # Strong references so in-flight dispatch tasks are not garbage collected
+        self.tasks: Set[asyncio.Task] = set()
+
+    def submit(self, item: T) -> asyncio.Future:
+        """Queue an item for the next batch; must be called on the event loop."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((item, future))
+        if len(self.pending) >= self.max_batch:
+            self._flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.max_wait, self._flush)
+        return future
+
+    async def drain(self) -> None:
+        """Dispatch everything queued so far and wait for it to complete."""
+        self._flush()
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        """Hand the pending items to a dispatch task."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Dispatch one batch and resolve each caller's future."""
+        try:
+            results = await self.dispatch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch dispatch returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            # The caller may have given up on its future
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
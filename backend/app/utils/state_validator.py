@@ -1,16 +1,40 @@
 """State machine validation utilities."""
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, Tuple
 from ..models.mvp import MVPState, VALID_TRANSITIONS, is_valid_transition, is_terminal_state
 
+# Immutable views built once at import; lookups return shared tuples
+_VALID_NEXT_STATES: Dict[MVPState, Tuple[MVPState, ...]] = {
+    state: tuple(targets) for state, targets in VALID_TRANSITIONS.items()
+}
 
-def get_valid_next_states(current_state: MVPState) -> List[MVPState]:
-    """Get list of valid next states from current state."""
-    return VALID_TRANSITIONS.get(current_state, [])
+_STATE_PATH_TO_COMPLETION: Dict[MVPState, Tuple[MVPState, ...]] = {
+    MVPState.CREATED: (MVPState.IDEATING, MVPState.ARCHITECTING, MVPState.BUILDING,
+                       MVPState.DEPLOYING, MVPState.TOKENIZING, MVPState.COMPLETED),
+    MVPState.IDEATING: (MVPState.ARCHITECTING, MVPState.BUILDING,
+                        MVPState.DEPLOYING, MVPState.TOKENIZING, MVPState.COMPLETED),
+    MVPState.ARCHITECTING: (MVPState.BUILDING, MVPState.DEPLOYING,
+                            MVPState.TOKENIZING, MVPState.COMPLETED),
+    MVPState.BUILDING: (MVPState.DEPLOYING, MVPState.TOKENIZING, MVPState.COMPLETED),
+    MVPState.BUILD_FAILED: (MVPState.BUILDING, MVPState.DEPLOYING,
+                            MVPState.TOKENIZING, MVPState.COMPLETED),
+    MVPState.DEPLOYING: (MVPState.TOKENIZING, MVPState.COMPLETED),
+    MVPState.DEPLOY_FAILED: (MVPState.DEPLOYING, MVPState.TOKENIZING, MVPState.COMPLETED),
+    MVPState.TOKENIZING: (MVPState.COMPLETED,),
+    MVPState.COMPLETED: (),
+    MVPState.FAILED: (),
+}
 
 
+def get_valid_next_states(current_state: MVPState) -> Tuple[MVPState, ...]:
+    """Get the valid next states from current state."""
+    return _VALID_NEXT_STATES.get(current_state, ())
+
+
+@lru_cache(maxsize=1)
 def validate_state_machine_integrity() -> bool:
-    """Validate state machine configuration integrity."""
+    """Validate state machine configuration integrity (checked once per process)."""
     # Ensure all states are defined in transitions
     all_states = set(MVPState)
     defined_states = set(VALID_TRANSITIONS.keys())
@@ -33,22 +57,6 @@ def validate_state_machine_integrity() -> bool:
     return True
 
 
-def get_state_path_to_completion(current_state: MVPState) -> List[MVPState]:
+def get_state_path_to_completion(current_state: MVPState) -> Tuple[MVPState, ...]:
     """Get the expected path from current state to completion."""
-    paths = {
-        MVPState.CREATED: [MVPState.IDEATING, MVPState.ARCHITECTING, MVPState.BUILDING, 
-                          MVPState.DEPLOYING, MVPState.TOKENIZING, MVPState.COMPLETED],
-        MVPState.IDEATING: [MVPState.ARCHITECTING, MVPState.BUILDING, 
-                           MVPState.DEPLOYING, MVPState.TOKENIZING, MVPState.COMPLETED],
-        MVPState.ARCHITECTING: [MVPState.BUILDING, MVPState.DEPLOYING, 
-                               MVPState.TOKENIZING, MVPState.COMPLETED],
-        MVPState.BUILDING: [MVPState.DEPLOYING, MVPState.TOKENIZING, MVPState.COMPLETED],
-        MVPState.BUILD_FAILED: [MVPState.BUILDING, MVPState.DEPLOYING, 
-                               MVPState.TOKENIZING, MVPState.COMPLETED],
-        MVPState.DEPLOYING: [MVPState.TOKENIZING, MVPState.COMPLETED],
-        MVPState.DEPLOY_FAILED: [MVPState.DEPLOYING, MVPState.TOKENIZING, MVPState.COMPLETED],
-        MVPState.TOKENIZING: [MVPState.COMPLETED],
-        MVPState.COMPLETED: [],
-        MVPState.FAILED: [],
-    }
-    return paths.get(current_state, [])
+    return _STATE_PATH_TO_COMPLETION.get(current_state, ())
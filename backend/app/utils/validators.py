@@ -1,8 +1,17 @@
 """Validation utilities and helpers."""
 
-import re
 from typing import Optional
 
+_GITHUB_PREFIX = "https://github.com/"
+_ALLOWED_STAGES = frozenset(
+    {"ideation", "architecture", "building", "deploying", "tokenizing", "feedback"}
+)
+
+
+def _is_word(text: str, extra: str) -> bool:
+    """True if text is non-empty and every character is \\w or in extra."""
+    return bool(text) and all(c.isalnum() or c == "_" or c in extra for c in text)
+
 
 def validate_mvp_name(name: str) -> bool:
     """Validate MVP name format."""
@@ -13,17 +22,30 @@ def validate_mvp_name(name: str) -> bool:
 
 def validate_github_url(url: str) -> bool:
     """Validate GitHub repository URL."""
-    pattern = r"https://github\.com/[\w-]+/[\w-]+/?$"
-    return re.match(pattern, url) is not None
+    # https://github.com/<owner>/<repo> with an optional trailing slash
+    if not url.startswith(_GITHUB_PREFIX):
+        return False
+    rest = url[len(_GITHUB_PREFIX):]
+    if rest.endswith("/"):
+        rest = rest[:-1]
+    owner, sep, repo = rest.partition("/")
+    return bool(sep) and _is_word(owner, "-") and _is_word(repo, "-")
 
 
 def validate_deployment_url(url: str) -> bool:
     """Validate deployment URL format."""
-    pattern = r"https?://[\w.-]+\..*"
-    return re.match(pattern, url) is not None
+    # http(s)://, then host characters up to a dot that is not the first one
+    if url.startswith("https://"):
+        host = url[8:]
+    elif url.startswith("http://"):
+        host = url[7:]
+    else:
+        return False
+    dot = host.find(".", 1)
+    return dot > 0 and _is_word(host[:dot], ".-")
 
 
 def sanitize_stage_name(stage: str) -> str:
     """Sanitize agent stage name."""
-    allowed = {"ideation", "architecture", "building", "deploying", "tokenizing", "feedback"}
-    return stage.lower() if stage.lower() in allowed else "unknown"
+    stage = stage.lower()
+    return stage if stage in _ALLOWED_STAGES else "unknown"
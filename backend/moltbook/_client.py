@@ -0,0 +1,31 @@
+import httpx
+from importlib.util import find_spec
+from typing import Optional
+
+# One pooled client for the Moltbook scripts, so calls made in the same run
+# reuse the connection instead of repeating the TCP/TLS handshake
+_client: Optional[httpx.AsyncClient] = None
+
+# HTTP/2 lets the concurrent requests share one connection; httpx needs the
+# h2 package for it (pip install "httpx[http2]")
+_HTTP2 = find_spec("h2") is not None
+
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=httpx.Timeout(30),
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=20, keepalive_expiry=300
+            ),
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
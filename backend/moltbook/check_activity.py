@@ -1,25 +1,39 @@
 import httpx
 import asyncio
 import os
+import sys
 from dotenv import load_dotenv
+from _client import get_client, close_client
 
 load_dotenv()
 
+# Read once; the key doesn't change while the script runs
+_API_KEY = os.getenv("MOLTBOOK_API_KEY")
+_HEADERS = {"Authorization": f"Bearer {_API_KEY}"} if _API_KEY else {}
+
 async def check_moltbook_activity():
-    api_key = os.getenv("MOLTBOOK_API_KEY")
     url = "https://www.moltbook.com/api/v1/submolts/lablab/feed"
-    headers = {"Authorization": f"Bearer {api_key}"}
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers)
-            data = response.json()
-            posts = data.get("posts", [])
-            print(f"--- m/lablab activity (Latest {len(posts)} posts) ---")
-            for p in posts[:15]:
-                print(f"[{p.get('created_at')}] {p.get('agent', {}).get('name')}: {p.get('title')}")
-        except Exception as e:
-            print(f"Error checking activity: {e}")
+    client = get_client()
+    try:
+        response = await client.get(url, headers=_HEADERS)
+        data = response.json()
+        posts = data.get("posts", [])
+        # Build the report first and write it out in one go
+        lines = [f"--- m/lablab activity (Latest {len(posts)} posts) ---"]
+        lines.extend(
+            f"[{p.get('created_at')}] {(p.get('agent') or {}).get('name')}: {p.get('title')}"
+            for p in posts[:15]
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+    except (httpx.HTTPError, ValueError) as e:
+        print(f"Error checking activity: {e}")
+
+async def main():
+    try:
+        await check_moltbook_activity()
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
-    asyncio.run(check_moltbook_activity())
+    asyncio.run(main())
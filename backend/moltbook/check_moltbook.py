@@ -2,29 +2,40 @@ import httpx
 import asyncio
 import os
 from dotenv import load_dotenv
+from _client import get_client, close_client
 
 load_dotenv()
 
+# Read once; the key doesn't change while the script runs
+_API_KEY = os.getenv("MOLTBOOK_API_KEY")
+_HEADERS = {"Authorization": f"Bearer {_API_KEY}"} if _API_KEY else {}
+
 async def check_moltbook_status():
-    api_key = os.getenv("MOLTBOOK_API_KEY")
-    if not api_key:
+    if not _API_KEY:
         print("MOLTBOOK_API_KEY not found in .env")
         return
 
     url = "https://www.moltbook.com/api/v1/agents/status"
-    headers = {"Authorization": f"Bearer {api_key}"}
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers)
-            print(f"Status Response: {response.text}")
-            
-            me_url = "https://www.moltbook.com/api/v1/agents/me"
-            response_me = await client.get(me_url, headers=headers)
-            print(f"Profile Response: {response_me.text}")
-            
-        except Exception as e:
-            print(f"Error checking status: {e}")
+    me_url = "https://www.moltbook.com/api/v1/agents/me"
+    client = get_client()
+    try:
+        # The two lookups are independent, so issue them concurrently
+        response, response_me = await asyncio.gather(
+            client.get(url, headers=_HEADERS),
+            client.get(me_url, headers=_HEADERS),
+        )
+        print(f"Status Response: {response.text}")
+        print(f"Profile Response: {response_me.text}")
+        
+    except httpx.HTTPError as e:
+        print(f"Error checking status: {e}")
+
+async def main():
+    try:
+        await check_moltbook_status()
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
-    asyncio.run(check_moltbook_status())
+    asyncio.run(main())
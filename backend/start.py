@@ -1,6 +1,7 @@
 import uvicorn
 import os
 import sys
+from importlib.util import find_spec
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -18,10 +19,19 @@ def main():
     port = int(os.getenv("PORT", 8000))
     # Default to True for development convenience
     reload = os.getenv("RELOAD", "true").lower() == "true"
+    # Opt-in: SSE subscribers and running pipelines live in one process, and
+    # each worker resumes incomplete pipelines at startup. Reload needs 1 worker.
+    workers = 1 if reload else int(os.getenv("WORKERS", 1))
+    # uvloop and httptools come with uvicorn[standard]; uvloop has no Windows build
+    loop = "uvloop" if sys.platform != "win32" and find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
     
     print(f"🚀 EIDO Backend starting on http://{host}:{port}")
+    print(f"⚙️  Event loop: {loop}, HTTP parser: {http}")
     if reload:
         print("🔄 Hot reload enabled")
+    elif workers > 1:
+        print(f"👥 Running {workers} worker processes")
     
     # Run the server
     try:
@@ -30,7 +40,9 @@ def main():
             host=host,
             port=port,
             reload=reload,
-            workers=1,
+            workers=workers,
+            loop=loop,
+            http=http,
             log_level="info"
         )
     except KeyboardInterrupt:
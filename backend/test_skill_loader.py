@@ -1,11 +1,3 @@
-import sys
-import os
-from pathlib import Path
-
-# Add backend to sys.path
-backend_dir = Path(__file__).parent
-sys.path.append(str(backend_dir))
-
 from app.services.ai_runtime.skill_loader import SkillLoader
 
 def test_skill_loader():
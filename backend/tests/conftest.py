@@ -0,0 +1,24 @@
+"""Shared pytest setup for the backend test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the backend package (``app``) importable from every test module
+BACKEND_DIR = str(Path(__file__).parent.parent)
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session, so the app is only built once.
+
+    Not entered as a context manager: the lifespan would resume incomplete
+    pipelines from the local database.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)
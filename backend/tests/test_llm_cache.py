@@ -0,0 +1,62 @@
+"""Tests for the LLM response cache."""
+
+import pytest
+from types import SimpleNamespace
+from pydantic import BaseModel
+
+from app.services.ai_runtime.llm_cache import InMemoryLLMCache, make_cache_key
+from app.utils import ttl_cache
+
+
+class IdeaSchema(BaseModel):
+    name: str
+
+
+class TestLLMCache:
+    """Test LLM response caching."""
+
+    def test_cache_key_depends_on_model_prompt_and_schema(self):
+        """Test that every key component changes the cache key."""
+        base = make_cache_key("gpt-4o", "hello")
+        assert base == make_cache_key("gpt-4o", "hello")
+        assert base != make_cache_key("gpt-4o-mini", "hello")
+        assert base != make_cache_key("gpt-4o", "hello!")
+        assert base != make_cache_key("gpt-4o", "hello", IdeaSchema)
+        assert base != make_cache_key("gpt-4o", "hello", system_prompt="You are EIDO.")
+
+    def test_cache_key_distinguishes_same_named_schemas(self):
+        """Test that response models with the same name in different scopes get different keys."""
+        class IdeaSchema(BaseModel):
+            name: str
+
+        assert make_cache_key("gpt-4o", "hello", IdeaSchema) != make_cache_key(
+            "gpt-4o", "hello", globals()["IdeaSchema"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_in_memory_cache_roundtrip(self, monkeypatch):
+        """Test that stored values are returned until they expire."""
+        now = [1000.0]
+        monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        cache = InMemoryLLMCache()
+
+        assert await cache.get("key") is None
+        await cache.set("key", {"raw_output": "{}"}, ttl=1)
+        assert await cache.get("key") == {"raw_output": "{}"}
+
+        now[0] += 1.1
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_in_memory_cache_evicts_least_recently_used(self):
+        """Test LRU eviction once max_entries is exceeded."""
+        cache = InMemoryLLMCache(max_entries=2)
+
+        await cache.set("a", {"v": 1}, ttl=60)
+        await cache.set("b", {"v": 2}, ttl=60)
+        await cache.get("a")  # "b" is now least recently used
+        await cache.set("c", {"v": 3}, ttl=60)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"v": 1}
+        assert await cache.get("c") == {"v": 3}
@@ -0,0 +1,58 @@
+"""Tests for the micro-batcher."""
+
+import pytest
+import asyncio
+
+from app.utils.micro_batcher import MicroBatcher
+
+
+class RecordingDispatch:
+    """Dispatch that records each batch and echoes its items back."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, items):
+        self.batches.append(list(items))
+        return [RuntimeError(item) if item == "fail" else item.upper() for item in items]
+
+
+class TestMicroBatcher:
+    """Test coalescing of submitted items."""
+
+    @pytest.mark.asyncio
+    async def test_items_in_window_share_one_batch(self):
+        """Test that items inside the wait window are dispatched together."""
+        dispatch = RecordingDispatch()
+        batcher = MicroBatcher(dispatch, max_batch=16, max_wait_ms=20)
+
+        results = await asyncio.gather(*(batcher.submit(f"m{i}") for i in range(3)))
+
+        assert results == ["M0", "M1", "M2"]
+        assert dispatch.batches == [["m0", "m1", "m2"]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_and_errors_stay_per_item(self):
+        """Test max_batch flushing and that one failure does not fail its neighbours."""
+        dispatch = RecordingDispatch()
+        batcher = MicroBatcher(dispatch, max_batch=2, max_wait_ms=1000)
+
+        results = await asyncio.gather(
+            batcher.submit("ok"), batcher.submit("fail"), return_exceptions=True
+        )
+
+        assert results[0] == "OK"
+        assert isinstance(results[1], RuntimeError)
+        assert dispatch.batches == [["ok", "fail"]]
+
+    @pytest.mark.asyncio
+    async def test_drain_sends_pending_items(self):
+        """Test that drain dispatches a partial batch without waiting for the timer."""
+        dispatch = RecordingDispatch()
+        batcher = MicroBatcher(dispatch, max_batch=16, max_wait_ms=60_000)
+
+        future = batcher.submit("solo")
+        await batcher.drain()
+
+        assert future.result() == "SOLO"
+        assert dispatch.batches == [["solo"]]
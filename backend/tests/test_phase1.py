@@ -1,9 +1,4 @@
 import asyncio
-import sys
-from pathlib import Path
-
-# Add the project root to sys.path
-sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from app.services.ai_runtime.llm_router import LLMRouter, TaskType
 from pydantic import BaseModel
@@ -1,16 +1,13 @@
 import asyncio
 import sys
 import io
-from pathlib import Path
 
 # Force UTF-8 encoding for stdout/stderr to handle emojis on Windows
-if sys.stdout and sys.stdout.encoding.lower() != 'utf-8':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-if sys.stderr and sys.stderr.encoding.lower() != 'utf-8':
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
-
-# Add the project root to sys.path
-sys.path.append(str(Path(__file__).parent.parent.parent))
+if sys.platform == "win32":
+    if sys.stdout and (getattr(sys.stdout, "encoding", None) or "").lower() != 'utf-8':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True)
+    if sys.stderr and (getattr(sys.stderr, "encoding", None) or "").lower() != 'utf-8':
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', line_buffering=True)
 
 from app.services.ai_runtime.crewai_service import CrewAIService
 from app.logger import configure_logging
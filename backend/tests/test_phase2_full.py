@@ -1,57 +1,45 @@
 """Full Phase 2 Orchestration Test — All 5 Stages Sequential."""
 import asyncio
-import sys
 import time
 import json
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
 
 from app.services.ai_runtime.crewai_service import CrewAIService
 
 
-STAGES = [
-    {
-        "name": "ideation",
-        "context": {
-            "raw_idea": "An AI-powered platform that automatically generates SaaS MVPs from a single idea."
-        },
-        "agents": ["Market Researcher", "Business Analyst"],
-        "pass_key": "features",  # Key to extract and pass to next stage
-    },
-    {
-        "name": "architecture",
-        "context": {
-            "features": None,  # Filled from ideation output
-        },
-        "agents": ["System Architect", "Tech Lead"],
-        "pass_key": "spec",
-    },
-    {
-        "name": "building",
-        "context": {
-            "spec": None,  # Filled from architecture output
-        },
-        "agents": ["Full Stack Developer", "QA Engineer"],
-        "pass_key": "build_path",
-    },
-    {
-        "name": "deployment",
-        "context": {
-            "build_path": None,  # Filled from building output
-        },
-        "agents": ["DevOps Engineer"],
-        "pass_key": "mvp_name",
-    },
-    {
-        "name": "tokenization",
-        "context": {
-            "mvp_name": None,  # Filled from deployment output
-        },
-        "agents": ["Blockchain Specialist"],
-        "pass_key": None,
-    },
-]
+@dataclass(frozen=True)
+class StageDef:
+    """One orchestration stage; never mutated, so the run can be repeated."""
+    name: str
+    agents: Tuple[str, ...]
+    role_ids: Tuple[str, ...]  # Skill profiles behind the agents
+    pass_key: Optional[str]  # Key the next stage receives this stage's output under
+    base_context: Dict[str, Any] = field(default_factory=dict)
+
+
+STAGES = (
+    StageDef(
+        "ideation",
+        ("Market Researcher", "Business Analyst"),
+        ("researcher", "analyst"),
+        "features",
+        {"raw_idea": "An AI-powered platform that automatically generates SaaS MVPs from a single idea."},
+    ),
+    StageDef("architecture", ("System Architect", "Tech Lead"), ("architect", "tech_lead"), "spec"),
+    StageDef("building", ("Full Stack Developer", "QA Engineer"), ("developer", "qa"), "build_path"),
+    StageDef("deployment", ("DevOps Engineer",), ("devops",), "mvp_name"),
+    StageDef("tokenization", ("Blockchain Specialist",), ("blockchain",), None),
+)
+
+
+async def prewarm_agents(service: CrewAIService, role_ids):
+    """Construct (and cache on the service) the agents for role_ids off the loop."""
+    try:
+        await asyncio.to_thread(lambda: [service._get_agent(role_id) for role_id in role_ids])
+    except Exception as e:
+        # execute_crew will build them itself and report any real failure
+        print(f"  (agent prewarm failed: {e})")
 
 
 async def run_full_orchestration():
@@ -66,30 +54,41 @@ async def run_full_orchestration():
     results = {}
     total_tokens = 0
     total_cost = 0.0
-    total_start = time.time()
+    total_start = time.perf_counter()
+    # What the previous stage handed over, keyed by its pass_key
+    handoff: Dict[str, Any] = {}
     
     for i, stage in enumerate(STAGES):
-        stage_name = stage["name"]
-        context = stage["context"]
+        stage_name = stage.name
+        context = {**stage.base_context, **handoff}
+        handoff = {}
         
         print(f"\n{'─' * 70}")
         print(f"  Stage {i+1}/5: {stage_name.upper()}")
-        print(f"  Agents: {', '.join(stage['agents'])}")
+        print(f"  Agents: {', '.join(stage.agents)}")
         print(f"{'─' * 70}")
         
-        start = time.time()
+        start = time.perf_counter()
+        
+        # Stages form a strict chain, but the next stage's agents don't depend
+        # on this stage's output: build them while this stage's LLM calls run
+        prewarm = None
+        if i + 1 < len(STAGES):
+            prewarm = asyncio.create_task(
+                prewarm_agents(service, STAGES[i + 1].role_ids)
+            )
         
         try:
             result = await service.execute_crew(stage_name=stage_name, context=context)
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             
             print(f"\n  ✅ {stage_name.upper()} — Completed in {elapsed:.1f}s")
             print(f"  Model: {result.model_used}")
             print(f"  Tokens: {result.token_usage}")
             print(f"  Cost: ${result.cost_estimate:.4f}")
             
-            # Show output preview
-            output_str = json.dumps(result.output_json, indent=2) if isinstance(result.output_json, dict) else str(result.output_json)
+            # Serialize once, compactly: only the first 500 chars are ever used
+            output_str = json.dumps(result.output_json, separators=(",", ":")) if isinstance(result.output_json, dict) else str(result.output_json)
             preview = output_str[:200] + "..." if len(output_str) > 200 else output_str
             print(f"  Output: {preview}")
             
@@ -99,26 +98,26 @@ async def run_full_orchestration():
             total_cost += result.cost_estimate
             
             # Pass output as context to the next stage
-            if stage["pass_key"] and i + 1 < len(STAGES):
-                next_stage = STAGES[i + 1]
+            if stage.pass_key and i + 1 < len(STAGES):
                 # Try to pass structured data, fall back to raw output string
-                pass_value = output_str[:500]  # Limit context size
-                next_stage["context"][stage["pass_key"]] = pass_value
+                handoff[stage.pass_key] = output_str[:500]  # Limit context size
                 
         except Exception as e:
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             print(f"\n  ❌ {stage_name.upper()} — FAILED after {elapsed:.1f}s")
             print(f"  Error: {e}")
             
             # Still try to continue with next stage using dummy context
-            if stage["pass_key"] and i + 1 < len(STAGES):
-                next_stage = STAGES[i + 1]
-                next_stage["context"][stage["pass_key"]] = f"Previous stage ({stage_name}) failed"
+            if stage.pass_key and i + 1 < len(STAGES):
+                handoff[stage.pass_key] = f"Previous stage ({stage_name}) failed"
             
             results[stage_name] = {"error": str(e)}
+        
+        if prewarm is not None:
+            await prewarm
     
     # Final summary
-    total_elapsed = time.time() - total_start
+    total_elapsed = time.perf_counter() - total_start
     
     print(f"\n{'=' * 70}")
     print(f"  ORCHESTRATION COMPLETE")
@@ -2,13 +2,13 @@
 
 import pytest
 import asyncio
-from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 
-from app.main import app
 from app.middleware.rate_limiter import (
     InMemoryRateLimiter,
+    TokenBucketLimiter,
     parse_rate_limit,
+    parse_rate_limit_spec,
     get_client_identifier,
 )
 from app.monitoring.metrics import (
@@ -62,12 +62,40 @@ class TestRateLimiting:
         is_allowed, _ = await limiter.is_allowed("test_key", 3, 1)
         assert is_allowed is True
     
-    def test_parse_rate_limit_valid(self):
+    @pytest.mark.asyncio
+    async def test_token_bucket_limiter_blocks_over_limit(self):
+        """Test that the token bucket blocks once its burst is spent."""
+        limiter = TokenBucketLimiter()
+        
+        # Spend the whole bucket
+        for i in range(5):
+            is_allowed, retry_after = await limiter.is_allowed("test_key", 5, 60)
+            assert is_allowed is True
+            assert retry_after == 0
+        
+        # 6th request should be blocked until a token is refilled
+        is_allowed, retry_after = await limiter.is_allowed("test_key", 5, 60)
+        assert is_allowed is False
+        assert retry_after > 0
+    
+    def test_parse_rate_limit_spec_algorithm(self):
+        """Test parsing the optional algorithm suffix."""
+        assert parse_rate_limit_spec("10/second") == (10, 1, "sliding")
+        assert parse_rate_limit_spec("10/second:bucket") == (10, 1, "bucket")
+        assert parse_rate_limit("10/second:bucket") == (10, 1)
+        
+        with pytest.raises(ValueError):
+            parse_rate_limit_spec("10/second:leaky")
+    
+    @pytest.mark.parametrize("limit_str,expected", [
+        ("10/second", (10, 1)),
+        ("100/minute", (100, 60)),
+        ("1000/hour", (1000, 3600)),
+        ("10000/day", (10000, 86400)),
+    ])
+    def test_parse_rate_limit_valid(self, limit_str, expected):
         """Test parsing valid rate limit strings."""
-        assert parse_rate_limit("10/second") == (10, 1)
-        assert parse_rate_limit("100/minute") == (100, 60)
-        assert parse_rate_limit("1000/hour") == (1000, 3600)
-        assert parse_rate_limit("10000/day") == (10000, 86400)
+        assert parse_rate_limit(limit_str) == expected
     
     def test_parse_rate_limit_invalid(self):
         """Test parsing invalid rate limit strings."""
@@ -77,34 +105,24 @@ class TestRateLimiting:
         with pytest.raises(ValueError):
             parse_rate_limit("10/invalid_period")
     
-    def test_get_client_identifier_from_user_id(self):
-        """Test client identification from user ID."""
-        request = Mock()
-        request.state.user_id = "user123"
-        request.headers = {}
-        
-        identifier = get_client_identifier(request)
-        assert identifier == "user:user123"
-    
-    def test_get_client_identifier_from_api_key(self):
-        """Test client identification from API key."""
+    @pytest.mark.parametrize("user_id,headers,client_host,expected", [
+        ("user123", {}, None, "user:user123"),
+        (None, {"X-API-Key": "sk-1234567890abcdef"}, None, "apikey:sk-1234567890ab"),
+        (None, {}, "192.168.1.1", "ip:192.168.1.1"),
+    ], ids=["user_id", "api_key", "ip"])
+    def test_get_client_identifier(self, user_id, headers, client_host, expected):
+        """Test client identification from user ID, then API key, then IP address."""
         request = Mock()
-        request.state = Mock(spec=[])  # No user_id
-        request.headers = {"X-API-Key": "sk-1234567890abcdef"}
-        
-        identifier = get_client_identifier(request)
-        assert identifier == "apikey:sk-1234567890ab"
-    
-    def test_get_client_identifier_from_ip(self):
-        """Test client identification from IP address."""
-        request = Mock()
-        request.state = Mock(spec=[])
-        request.headers = {}
-        request.client = Mock()
-        request.client.host = "192.168.1.1"
-        
-        identifier = get_client_identifier(request)
-        assert identifier == "ip:192.168.1.1"
+        if user_id is not None:
+            request.state.user_id = user_id
+        else:
+            request.state = Mock(spec=[])  # No user_id
+        request.headers = headers
+        if client_host is not None:
+            request.client = Mock()
+            request.client.host = client_host
+        
+        assert get_client_identifier(request) == expected
 
 
 class TestMetrics:
@@ -138,9 +156,8 @@ class TestMetrics:
 class TestHealthChecks:
     """Test health check endpoints."""
     
-    def test_basic_health_check(self):
+    def test_basic_health_check(self, client):
         """Test basic health check endpoint."""
-        client = TestClient(app)
         response = client.get("/health")
         
         assert response.status_code == 200
@@ -149,9 +166,8 @@ class TestHealthChecks:
         assert "version" in data
         assert "timestamp" in data
     
-    def test_deep_health_check(self):
+    def test_deep_health_check(self, client):
         """Test deep health check endpoint."""
-        client = TestClient(app)
         response = client.get("/health/deep")
         
         assert response.status_code == 200
@@ -164,9 +180,8 @@ class TestHealthChecks:
 class TestRateLimitingIntegration:
     """Integration tests for rate limiting."""
     
-    def test_rate_limit_headers_present(self):
+    def test_rate_limit_headers_present(self, client):
         """Test that rate limit headers are present in responses."""
-        client = TestClient(app)
         response = client.get("/api/mvp/list")
         
         # Check for rate limit headers
@@ -175,10 +190,8 @@ class TestRateLimitingIntegration:
         assert "X-RateLimit-Reset" in response.headers
     
     @pytest.mark.skip(reason="Requires actual rate limit to be hit")
-    def test_rate_limit_exceeded_response(self):
+    def test_rate_limit_exceeded_response(self, client):
         """Test response when rate limit is exceeded."""
-        client = TestClient(app)
-        
         # Make many requests to exceed limit
         for i in range(200):
             response = client.get("/api/mvp/list")
@@ -193,17 +206,15 @@ class TestRateLimitingIntegration:
 class TestMetricsEndpoint:
     """Test metrics endpoint."""
     
-    def test_metrics_endpoint_accessible(self):
+    def test_metrics_endpoint_accessible(self, client):
         """Test that metrics endpoint is accessible."""
-        client = TestClient(app)
         response = client.get("/metrics")
         
         assert response.status_code == 200
         assert "text/plain" in response.headers["content-type"]
     
-    def test_metrics_endpoint_contains_metrics(self):
+    def test_metrics_endpoint_contains_metrics(self, client):
         """Test that metrics endpoint returns Prometheus format."""
-        client = TestClient(app)
         response = client.get("/metrics")
         
         content = response.text
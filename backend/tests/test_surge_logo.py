@@ -50,13 +50,29 @@ async def test_logo(client, url):
         print(f"  ERROR: {e}")
         return False
 
+# A passing probe is a real launch, so by default probe one URL at a time;
+# raise this to trade possible extra launches for a faster search
+PROBE_CONCURRENCY = int(os.getenv("SURGE_LOGO_PROBE_CONCURRENCY", "1"))
+
 async def main():
+    sem = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+    async def _bounded(client, url):
+        async with sem:
+            return url, await test_logo(client, url)
+
     async with httpx.AsyncClient() as client:
-        for url in CANDIDATES:
-            ok = await test_logo(client, url)
-            if ok:
-                print(f"\n  ✅ WORKING URL: {url}\n")
-                break
-            await asyncio.sleep(1)
+        tasks = [asyncio.create_task(_bounded(client, url)) for url in CANDIDATES]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                url, ok = await next_done
+                if ok:
+                    print(f"\n  ✅ WORKING URL: {url}\n")
+                    break
+        finally:
+            # Stop probing once one URL works
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
 asyncio.run(main())
@@ -1,13 +1,27 @@
-import sys
 import json
-from pathlib import Path
-
-# Add project root to sys.path
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from itertools import chain
 
 from app.agent.context_optimizer import ContextOptimizer
 from app.services.ai_runtime.toon_adapter import get_toon_adapter
 
+# Simulated noisy build log, assembled in test_toon_system
+_TS_INFO = "2026-02-27 19:40:05 INFO: "
+_TS_DEBUG = "2026-02-27 19:40:07 DEBUG: "
+_BUILD_HEADER = (
+    "2026-02-27 19:40:01 INFO: Initializing build environment...",
+    "2026-02-27 19:40:02 INFO: Loading dependencies...",
+    "2026-02-27 19:40:03 INFO: Checking cache for layer 1",
+    "2026-02-27 19:40:04 INFO: Checking cache for layer 2",
+)
+_BUILD_ERRORS = (
+    "2026-02-27 19:40:06 ERROR: SyntaxError at /app/services/ai_runtime/crew_service.py:145",
+    "    -> line 145: result = await kickoff()",
+    "    -> Unexpected token '('",
+)
+_BUILD_FOOTER = (
+    "2026-02-27 19:40:08 FATAL: Build process terminated prematurely!",
+)
+
 def test_toon_system():
     print("="*60)
     print("      EIDO TOON COMPRESSION & OPTIMIZATION TEST")
@@ -66,26 +80,18 @@ def test_toon_system():
 
     # 3. Test Log Compression (Simulating a MASSIVE noisy build)
     print(f"\n[3] LOG COMPRESSION (Massive Noisy Build)")
-    massive_noise = [
-        "2026-02-27 19:40:01 INFO: Initializing build environment...",
-        "2026-02-27 19:40:02 INFO: Loading dependencies...",
-        "2026-02-27 19:40:03 INFO: Checking cache for layer 1",
-        "2026-02-27 19:40:04 INFO: Checking cache for layer 2",
-    ]
-    # Add 20 lines of "INFO" fluff
-    massive_noise.extend([f"2026-02-27 19:40:05 INFO: Compiling module_{i}.py..." for i in range(20)])
-    
-    # Inject the actual CRITICAL ERRORS in the middle of the noise
-    massive_noise.append("2026-02-27 19:40:06 ERROR: SyntaxError at /app/services/ai_runtime/crew_service.py:145")
-    massive_noise.append("    -> line 145: result = await kickoff()")
-    massive_noise.append("    -> Unexpected token '('")
-    
-    # Add 10 more lines of fluff
-    massive_noise.extend([f"2026-02-27 19:40:07 DEBUG: Cleaning up temp files {i}..." for i in range(10)])
-    massive_noise.append("2026-02-27 19:40:08 FATAL: Build process terminated prematurely!")
-    
-    raw_logs = "\n".join(massive_noise)
-    print(f"    Original Log Size:   {len(raw_logs)} chars ({len(massive_noise)} lines)")
+    raw_logs = "\n".join(chain(
+        _BUILD_HEADER,
+        # 20 lines of "INFO" fluff
+        (f"{_TS_INFO}Compiling module_{i}.py..." for i in range(20)),
+        # The actual CRITICAL ERRORS in the middle of the noise
+        _BUILD_ERRORS,
+        # 10 more lines of fluff
+        (f"{_TS_DEBUG}Cleaning up temp files {i}..." for i in range(10)),
+        _BUILD_FOOTER,
+    ))
+    line_count = raw_logs.count("\n") + 1
+    print(f"    Original Log Size:   {len(raw_logs)} chars ({line_count} lines)")
     
     compressed_logs = optimizer.compress_logs(raw_logs)
     print(f"    Compressed Log Size: {len(compressed_logs)} chars")
@@ -5,9 +5,6 @@ Validates AI Runtime layer, guardrails, and integration.
 """
 
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent))
 
 
 def validate_ai_runtime_imports():
@@ -106,10 +103,9 @@ def validate_database_schema():
             'total_token_usage', 'total_cost_estimate', 
             'max_allowed_cost', 'execution_trace_id', 'last_error_stage'
         }
-        mvp_fields = set(MVP.model_fields.keys())
-        
-        if not mvp_ai_fields.issubset(mvp_fields):
-            missing = mvp_ai_fields - mvp_fields
+        # model_fields.keys() is set-like, so no copy is needed
+        missing = mvp_ai_fields - MVP.model_fields.keys()
+        if missing:
             raise ValueError(f"MVP missing AI fields: {missing}")
         print(f"  ✓ MVP has all AI Runtime fields")
         
@@ -118,10 +114,8 @@ def validate_database_schema():
             'stage_input_json', 'stage_output_json',
             'llm_model', 'token_usage', 'cost_estimate'
         }
-        run_fields = set(AgentRun.model_fields.keys())
-        
-        if not run_ai_fields.issubset(run_fields):
-            missing = run_ai_fields - run_fields
+        missing = run_ai_fields - AgentRun.model_fields.keys()
+        if missing:
             raise ValueError(f"AgentRun missing AI fields: {missing}")
         print(f"  ✓ AgentRun has all AI Runtime fields")
         
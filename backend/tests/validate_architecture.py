@@ -7,9 +7,6 @@ Validates state machine, imports, and architectural patterns.
 import sys
 from pathlib import Path
 
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 
 def validate_imports():
     """Validate all critical imports work."""
@@ -72,19 +69,17 @@ def validate_models():
         from app.models.agent_run import AgentRun
         
         # Check MVP fields
-        mvp_fields = MVP.model_fields.keys()
         required_mvp_fields = {'id', 'name', 'status', 'retry_count', 'created_at', 'updated_at'}
-        if not required_mvp_fields.issubset(mvp_fields):
-            missing = required_mvp_fields - set(mvp_fields)
+        missing = required_mvp_fields - MVP.model_fields.keys()
+        if missing:
             raise ValueError(f"MVP missing fields: {missing}")
         print(f"  ✓ MVP model has all required fields")
         
         # Check AgentRun fields
-        run_fields = AgentRun.model_fields.keys()
         required_run_fields = {'id', 'mvp_id', 'stage', 'status', 'attempt_number', 
                               'started_at', 'completed_at', 'duration_ms'}
-        if not required_run_fields.issubset(run_fields):
-            missing = required_run_fields - set(run_fields)
+        missing = required_run_fields - AgentRun.model_fields.keys()
+        if missing:
             raise ValueError(f"AgentRun missing fields: {missing}")
         print(f"  ✓ AgentRun model has all required fields")
         
@@ -101,11 +96,10 @@ def validate_architecture():
     try:
         # Check controller has no business logic (should be minimal)
         from app.api.controllers import mvp_controller
-        controller_source = Path(__file__).parent / "app" / "api" / "controllers" / "mvp_controller.py"
-        controller_lines = controller_source.read_text().split('\n')
+        controller_source = Path(mvp_controller.__file__).read_text()
         
         # Controllers should delegate to services
-        if 'MVPService' not in controller_source.read_text():
+        if 'MVPService' not in controller_source:
             raise ValueError("Controller doesn't use service layer")
         print(f"  ✓ Controller delegates to service layer")
         
@@ -1,7 +1,12 @@
-from app.services.ai_runtime.skill_loader import SkillLoader
+from app.services.ai_runtime.skill_loader import get_skill_loader
+
+ROLES = ("analyst", "researcher", "architect", "tech_lead", "developer", "qa", "devops", "blockchain", "social_manager")
+
+# One loader for every role: the skills directory is indexed once and
+# profiles are cached
+loader = get_skill_loader()
 
 def test_parse(role_id):
-    loader = SkillLoader()
     try:
         profile = loader.load_skill(role_id)
         print(f"ROLE: {role_id}")
@@ -16,5 +21,5 @@ def test_parse(role_id):
     except Exception as e:
         print(f"Error loading {role_id}: {e}")
 
-for role in ["analyst", "researcher", "architect", "tech_lead", "developer", "qa", "devops", "blockchain", "social_manager"]:
+for role in ROLES:
     test_parse(role)